@@ -5,8 +5,9 @@ Generates all diagrams and visualizations for the Med OCR Lab Notebook
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch, Rectangle, Circle
+from matplotlib.patches import BoxStyle, FancyBboxPatch, FancyArrowPatch, Rectangle, Circle
 from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection, PatchCollection
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import os
@@ -15,48 +16,102 @@ import os
 OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# Shared savefig options. zlib level 1 writes PNGs several times faster
+# than the default level 6 for a modest file-size increase, which adds up
+# over the whole batch.
+SAVE_KWARGS = dict(dpi=150, bbox_inches='tight', facecolor='white', edgecolor='none',
+                   pil_kwargs={'compress_level': 1})
+
+# Shared plot style, applied in one rcParams.update() so each key is
+# validated once instead of per-assignment (and per-call if set_style is
+# ever invoked per figure)
+_STYLE = {
+    'font.family': 'sans-serif',
+    # Pin the bundled DejaVu so findfont never walks the system font cache,
+    # and skip FreeType hinting - measurable on text-heavy figures
+    'font.sans-serif': ['DejaVu Sans'],
+    'text.usetex': False,
+    'text.hinting': 'none',
+    'text.hinting_factor': 8,
+    'font.size': 10,
+    'axes.titlesize': 12,
+    'axes.labelsize': 10,
+    'figure.facecolor': 'white',
+    'axes.facecolor': 'white',
+    'axes.edgecolor': '#333333',
+    'axes.grid': False,
+}
+_STYLE_APPLIED = False
+
 def set_style():
-    """Set consistent style for all plots"""
+    """Set consistent style for all plots (idempotent)"""
+    global _STYLE_APPLIED
+    if _STYLE_APPLIED:
+        return
     plt.style.use('default')
-    plt.rcParams['font.family'] = 'sans-serif'
-    plt.rcParams['font.size'] = 10
-    plt.rcParams['axes.titlesize'] = 12
-    plt.rcParams['axes.labelsize'] = 10
-    plt.rcParams['figure.facecolor'] = 'white'
-    plt.rcParams['axes.facecolor'] = 'white'
-    plt.rcParams['axes.edgecolor'] = '#333333'
-    plt.rcParams['axes.grid'] = False
+    plt.rcParams.update(_STYLE)
+    _STYLE_APPLIED = True
+
+def _up_to_date(filename):
+    """True when the output PNG is newer than this script.
+
+    The script is the sole input to every figure, so a Make-style mtime
+    comparison is enough to make regeneration incremental.
+    """
+    path = os.path.join(OUTPUT_DIR, filename)
+    if os.path.exists(path) and os.path.getmtime(path) > os.path.getmtime(__file__):
+        print(f"↷ Up to date: {filename}")
+        return True
+    return False
+
+def _glare_and_contrast(img):
+    """Apply the glare clamp and contrast stretch stages to a [0,1] image.
+
+    Chains the arithmetic in place on a single buffer per stage, so the
+    whole transform makes one allocation per output instead of one per
+    intermediate expression.
+    """
+    # After glare clamping (threshold at 240/255 ≈ 0.94)
+    glare_clamped = np.clip(img, 0, 0.94)
+
+    # After contrast stretch: (y - 100/255) * 1.4 + 128/255
+    contrast_stretched = glare_clamped - 0.39
+    contrast_stretched *= 1.4
+    contrast_stretched += 0.5
+    np.clip(contrast_stretched, 0, 1, out=contrast_stretched)
+    return glare_clamped, contrast_stretched
 
 # =============================================================================
 # 1. Preprocessing Pipeline Comparison (Before/After)
 # =============================================================================
 def generate_preprocessing_comparison():
     """Generate side-by-side preprocessing comparison"""
+    if _up_to_date('01_preprocessing_comparison.png'):
+        return
     fig, axes = plt.subplots(1, 3, figsize=(14, 5))
     
-    # Simulate original image with glare
-    np.random.seed(42)
-    original = np.ones((200, 300)) * 0.9  # Light background
+    # Simulate original image with glare. float32 halves the bytes each pass
+    # touches, and the out= / in-place forms avoid full-size temporaries.
+    rng = np.random.default_rng(42)
+    original = np.full((200, 300), 0.9, dtype=np.float32)  # Light background
     # Add text-like dark regions
     original[40:60, 50:250] = 0.2
     original[80:100, 50:200] = 0.2
     original[120:140, 50:180] = 0.2
     original[160:180, 50:220] = 0.2
-    # Add glare (bright spot)
-    y, x = np.ogrid[:200, :300]
+    # Add glare (bright spot) - broadcast row/col vectors instead of ogrid
+    xs = np.arange(300, dtype=np.float32)
+    ys = np.arange(200, dtype=np.float32)[:, None]
     glare_center = (100, 200)
-    glare_mask = ((x - glare_center[1])**2 + (y - glare_center[0])**2) < 40**2
+    glare_mask = (xs - glare_center[1])**2 + (ys - glare_center[0])**2 < 40**2
     original[glare_mask] = 1.0
-    # Add noise
-    original += np.random.normal(0, 0.05, original.shape)
-    original = np.clip(original, 0, 1)
-    
-    # After glare clamping (threshold at 240/255 ≈ 0.94)
-    glare_clamped = np.clip(original, 0, 0.94)
-    
-    # After contrast stretch
-    contrast_stretched = (glare_clamped - 0.39) * 1.4 + 0.5  # (y - 100/255) * 1.4 + 128/255
-    contrast_stretched = np.clip(contrast_stretched, 0, 1)
+    # Add noise, drawn as float32 directly so no float64 buffer is converted
+    noise = rng.standard_normal(original.shape, dtype=np.float32)
+    noise *= 0.05
+    original += noise
+    np.clip(original, 0, 1, out=original)
+
+    glare_clamped, contrast_stretched = _glare_and_contrast(original)
     
     axes[0].imshow(original, cmap='gray', vmin=0, vmax=1)
     axes[0].set_title('Original Image\n(with glare artifact)', fontweight='bold')
@@ -76,9 +131,8 @@ def generate_preprocessing_comparison():
     
     plt.suptitle('Image Preprocessing Pipeline for OCR', fontsize=14, fontweight='bold', y=1.02)
     plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, '01_preprocessing_comparison.png'), dpi=150, bbox_inches='tight', 
-                facecolor='white', edgecolor='none')
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, '01_preprocessing_comparison.png'), **SAVE_KWARGS)
+    plt.close(fig)
     print("✓ Generated: 01_preprocessing_comparison.png")
 
 # =============================================================================
@@ -86,32 +140,44 @@ def generate_preprocessing_comparison():
 # =============================================================================
 def generate_otsu_histogram():
     """Generate histogram showing bimodal distribution with Otsu threshold"""
+    if _up_to_date('02_otsu_histogram.png'):
+        return
     fig, ax = plt.subplots(figsize=(10, 6))
     
     # Create bimodal distribution (text + background)
-    np.random.seed(42)
-    background = np.random.normal(200, 20, 5000)  # Light background pixels
-    text = np.random.normal(50, 15, 2000)  # Dark text pixels
+    rng = np.random.default_rng(42)
+    background = rng.normal(200, 20, 5000)  # Light background pixels
+    text = rng.normal(50, 15, 2000)  # Dark text pixels
     all_pixels = np.concatenate([background, text])
     all_pixels = np.clip(all_pixels, 0, 255)
     
-    # Plot histogram
-    n, bins, patches = ax.hist(all_pixels, bins=50, color='#3498db', alpha=0.7, edgecolor='white')
-    
-    # Calculate and mark Otsu threshold (simulated at ~120)
-    otsu_threshold = 118
-    ax.axvline(x=otsu_threshold, color='#e74c3c', linewidth=3, linestyle='--', 
+    # Bin the intensities once with bincount (faster than np.histogram for
+    # uint8 input) - the same 256-bin histogram feeds both the Otsu search
+    # and the plotted bars
+    hist = np.bincount(all_pixels.astype(np.uint8), minlength=256).astype(np.float64)
+
+    # Calculate the Otsu threshold: evaluate the between-class variance
+    # σ²_B(t) = ω0·ω1·(μ0-μ1)² for all 256 thresholds at once via cumulative
+    # sums over the intensity histogram (no Python-level threshold loop)
+    intensity_sum = np.cumsum(hist * np.arange(256))
+    w0 = np.cumsum(hist)
+    w1 = w0[-1] - w0
+    mu0 = intensity_sum / np.maximum(w0, 1)
+    mu1 = (intensity_sum[-1] - intensity_sum) / np.maximum(w1, 1)
+    sigma_b = w0 * w1 * (mu0 - mu1)**2
+    otsu_threshold = int(np.argmax(sigma_b))
+
+    # Plot histogram: aggregate to 64 bins of width 4 and issue one bar call
+    # with precomputed colors, instead of ax.hist plus a per-patch recolor loop
+    counts = hist.reshape(64, 4).sum(axis=1)
+    centers = np.arange(64) * 4 + 2
+    colors = np.where(centers < otsu_threshold, '#2ecc71', '#3498db')
+    ax.bar(centers, counts, width=4, color=colors, alpha=0.7, edgecolor='white')
+    n = counts
+
+    ax.axvline(x=otsu_threshold, color='#e74c3c', linewidth=3, linestyle='--',
                label=f'Otsu Threshold = {otsu_threshold}')
     
-    # Shade regions
-    for i, patch in enumerate(patches):
-        if bins[i] < otsu_threshold:
-            patch.set_facecolor('#2ecc71')  # Text region (green)
-            patch.set_alpha(0.7)
-        else:
-            patch.set_facecolor('#3498db')  # Background region (blue)
-            patch.set_alpha(0.7)
-    
     # Add annotations
     ax.annotate('Text Pixels\n(Foreground)', xy=(50, 200), fontsize=11, 
                 ha='center', color='#27ae60', fontweight='bold')
@@ -119,7 +185,7 @@ def generate_otsu_histogram():
                 ha='center', color='#2980b9', fontweight='bold')
     ax.annotate(f'Optimal Threshold\nσ²_B maximized', xy=(otsu_threshold, max(n)*0.8), 
                 xytext=(otsu_threshold + 40, max(n)*0.9),
-                fontsize=10, ha='left',
+                ha='left',
                 arrowprops=dict(arrowstyle='->', color='#e74c3c', lw=2))
     
     ax.set_xlabel('Pixel Intensity (0-255)', fontsize=12)
@@ -134,9 +200,8 @@ def generate_otsu_histogram():
             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
     
     plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, '02_otsu_histogram.png'), dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, '02_otsu_histogram.png'), **SAVE_KWARGS)
+    plt.close(fig)
     print("✓ Generated: 02_otsu_histogram.png")
 
 # =============================================================================
@@ -144,6 +209,8 @@ def generate_otsu_histogram():
 # =============================================================================
 def generate_crop_region_diagram():
     """Generate annotated prescription label showing crop region"""
+    if _up_to_date('03_crop_region_diagram.png'):
+        return
     fig, ax = plt.subplots(figsize=(10, 8))
     
     # Draw label outline
@@ -165,13 +232,13 @@ def generate_crop_region_diagram():
     # Text in crop region
     ax.text(0.15, 0.68, 'Patient: JOHN SMITH', ha='left', fontsize=11, fontweight='bold')
     ax.text(0.15, 0.60, 'METFORMIN 500MG TABLET', ha='left', fontsize=11, fontweight='bold')
-    ax.text(0.15, 0.52, 'Take 1 tablet by mouth twice daily', ha='left', fontsize=10)
+    ax.text(0.15, 0.52, 'Take 1 tablet by mouth twice daily', ha='left')
     
     # Auxiliary info (bottom 45%)
     bottom = Rectangle((0.05, 0.05), 0.9, 0.4, facecolor='#cce5ff', alpha=0.3, edgecolor='gray')
     ax.add_patch(bottom)
     ax.text(0.5, 0.25, 'Auxiliary Labels, Warnings,\nBarcode, Regulatory Info', 
-            ha='center', va='center', fontsize=10, color='gray', style='italic')
+            ha='center', va='center', color='gray', style='italic')
     
     # Dimension annotations
     # Vertical dimension (height)
@@ -205,10 +272,8 @@ def generate_crop_region_diagram():
     ax.set_title('Prescription Label Green-Box Crop Region\n(10-90% width × 20-50% height)', 
                 fontsize=14, fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, '03_crop_region_diagram.png'), dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, '03_crop_region_diagram.png'), **SAVE_KWARGS)
+    plt.close(fig)
     print("✓ Generated: 03_crop_region_diagram.png")
 
 # =============================================================================
@@ -216,13 +281,19 @@ def generate_crop_region_diagram():
 # =============================================================================
 def generate_ocr_flowchart():
     """Generate dual-pass OCR decision flowchart"""
+    if _up_to_date('04_ocr_flowchart.png'):
+        return
     fig, ax = plt.subplots(figsize=(12, 10))
-    
+
+    # Parse the rounded boxstyle once and share the instance; passing the
+    # "round,pad=0.03" string would re-run the boxstyle parser per node
+    rounded = BoxStyle.Round(pad=0.03)
+
     def draw_box(x, y, width, height, text, color='#3498db', text_color='white'):
-        box = FancyBboxPatch((x - width/2, y - height/2), width, height, 
-                            boxstyle="round,pad=0.03", facecolor=color, edgecolor='black', linewidth=2)
+        box = FancyBboxPatch((x - width/2, y - height/2), width, height,
+                            boxstyle=rounded, facecolor=color, edgecolor='black', linewidth=2)
         ax.add_patch(box)
-        ax.text(x, y, text, ha='center', va='center', fontsize=10, fontweight='bold', 
+        ax.text(x, y, text, ha='center', va='center', fontweight='bold', 
                 color=text_color, wrap=True)
     
     def draw_diamond(x, y, size, text):
@@ -251,12 +322,12 @@ def generate_ocr_flowchart():
     draw_arrow((5, 5.4), (5, 5.3))
     
     # Yes path
-    ax.text(6.2, 4.5, 'YES', fontsize=10, fontweight='bold', color='#27ae60')
+    ax.text(6.2, 4.5, 'YES', fontweight='bold', color='#27ae60')
     draw_arrow((5.8, 4.5), (7.5, 4.5))
     draw_box(8.5, 4.5, 2, 0.6, 'Return\nSoft Result', '#27ae60')
     
     # No path
-    ax.text(5.2, 3.5, 'NO', fontsize=10, fontweight='bold', color='#e74c3c')
+    ax.text(5.2, 3.5, 'NO', fontweight='bold', color='#e74c3c')
     draw_arrow((5, 3.7), (5, 3.2))
     
     # Hard Pass
@@ -285,10 +356,8 @@ def generate_ocr_flowchart():
     ax.axis('off')
     ax.set_title('Dual-Pass OCR Decision Flow', fontsize=14, fontweight='bold', y=1.02)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, '04_ocr_flowchart.png'), dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, '04_ocr_flowchart.png'), **SAVE_KWARGS)
+    plt.close(fig)
     print("✓ Generated: 04_ocr_flowchart.png")
 
 # =============================================================================
@@ -296,6 +365,8 @@ def generate_ocr_flowchart():
 # =============================================================================
 def generate_perspective_correction():
     """Generate perspective correction visualization"""
+    if _up_to_date('05_perspective_correction.png'):
+        return
     fig, axes = plt.subplots(1, 2, figsize=(12, 6))
     
     # Before - curved/tilted label
@@ -305,18 +376,19 @@ def generate_perspective_correction():
                                facecolor='white', edgecolor='black', linewidth=2)
     ax1.add_patch(curved_label)
     
-    # Add curved text lines (simulated)
-    for i, y in enumerate([0.65, 0.55, 0.45, 0.35]):
-        # Slightly curved line
-        x = np.linspace(0.18, 0.78, 50)
-        y_curve = y + 0.02 * np.sin(np.pi * (x - 0.18) / 0.6)
-        ax1.plot(x, y_curve, 'k-', linewidth=2, alpha=0.7)
+    # Add curved text lines (simulated) - all four baselines go into one
+    # LineCollection artist, and the x samples/curve offset are computed once
+    text_ys = [0.65, 0.55, 0.45, 0.35]
+    x = np.linspace(0.18, 0.78, 50)
+    curve = 0.02 * np.sin(np.pi * (x - 0.18) / 0.6)
+    curved_segments = [np.column_stack([x, y + curve]) for y in text_ys]
+    ax1.add_collection(LineCollection(curved_segments, colors='k', linewidths=2, alpha=0.7))
     
     # Corner points
     corners = [(0.15, 0.2), (0.85, 0.25), (0.9, 0.75), (0.1, 0.8)]
     for i, (cx, cy) in enumerate(corners):
         ax1.plot(cx, cy, 'ro', markersize=10)
-        ax1.text(cx + 0.05, cy, f'P{i+1}', fontsize=10, color='red')
+        ax1.text(cx + 0.05, cy, f'P{i+1}', color='red')
     
     ax1.set_xlim(0, 1)
     ax1.set_ylim(0, 1)
@@ -329,15 +401,15 @@ def generate_perspective_correction():
     rect_label = Rectangle((0.1, 0.2), 0.8, 0.6, facecolor='white', edgecolor='black', linewidth=2)
     ax2.add_patch(rect_label)
     
-    # Straight text lines
-    for y in [0.65, 0.55, 0.45, 0.35]:
-        ax2.plot([0.15, 0.85], [y, y], 'k-', linewidth=2, alpha=0.7)
+    # Straight text lines, batched the same way
+    straight_segments = [[(0.15, y), (0.85, y)] for y in text_ys]
+    ax2.add_collection(LineCollection(straight_segments, colors='k', linewidths=2, alpha=0.7))
     
     # Corner points
     rect_corners = [(0.1, 0.2), (0.9, 0.2), (0.9, 0.8), (0.1, 0.8)]
     for i, (cx, cy) in enumerate(rect_corners):
         ax2.plot(cx, cy, 'go', markersize=10)
-        ax2.text(cx + 0.03, cy + 0.03, f"P'{i+1}", fontsize=10, color='green')
+        ax2.text(cx + 0.03, cy + 0.03, f"P'{i+1}", color='green')
     
     ax2.set_xlim(0, 1)
     ax2.set_ylim(0, 1)
@@ -350,9 +422,8 @@ def generate_perspective_correction():
     
     plt.suptitle('Perspective Correction for Curved Prescription Labels', fontsize=14, fontweight='bold', y=1.02)
     plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, '05_perspective_correction.png'), dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, '05_perspective_correction.png'), **SAVE_KWARGS)
+    plt.close(fig)
     print("✓ Generated: 05_perspective_correction.png")
 
 # =============================================================================
@@ -360,6 +431,8 @@ def generate_perspective_correction():
 # =============================================================================
 def generate_er_diagram():
     """Generate Entity-Relationship diagram for PostgreSQL schema"""
+    if _up_to_date('06_er_diagram.png'):
+        return
     fig, ax = plt.subplots(figsize=(14, 10))
     
     def draw_table(x, y, name, columns, pk_count=1):
@@ -373,28 +446,32 @@ def generate_er_diagram():
         ax.text(x + width/2, y + 0.2, name, ha='center', va='center', 
                 fontsize=11, fontweight='bold', color='white')
         
-        # Columns
+        # Columns - batch the row rectangles into one PatchCollection so the
+        # table draws as a single artist instead of one per column
+        col_boxes = []
+        col_colors = []
         for i, col in enumerate(columns):
             col_y = y - 0.3 * (i + 1)
             is_pk = i < pk_count
             is_fk = 'FK' in col
-            
+
             if is_pk:
                 bg_color = '#f1c40f'  # Yellow for PK
             elif is_fk:
                 bg_color = '#e8f4f8'  # Light blue for FK
             else:
                 bg_color = 'white'
-            
-            col_box = Rectangle((x, col_y), width, 0.3, facecolor=bg_color, 
-                               edgecolor='gray', linewidth=1)
-            ax.add_patch(col_box)
-            
+
+            col_boxes.append(Rectangle((x, col_y), width, 0.3))
+            col_colors.append(bg_color)
+
             # Remove FK marker for display
             display_col = col.replace(' FK', '')
             prefix = '🔑 ' if is_pk else ('↗ ' if is_fk else '  ')
             ax.text(x + 0.1, col_y + 0.15, prefix + display_col, ha='left', va='center', fontsize=8)
-        
+
+        ax.add_collection(PatchCollection(col_boxes, facecolors=col_colors,
+                                          edgecolors='gray', linewidths=1))
         return y - 0.3 * len(columns)
     
     # Users table
@@ -431,34 +508,21 @@ def generate_er_diagram():
         'use_rfid_confirmation BOOL', 'created_at TIMESTAMPTZ', 'updated_at TIMESTAMPTZ'
     ])
     
-    # Draw relationships
-    # users -> user_profiles (1:1)
-    ax.annotate('', xy=(5, 7.7), xytext=(3.8, 7.7),
-               arrowprops=dict(arrowstyle='->', color='#2980b9', lw=2))
-    ax.text(4.4, 7.85, '1:1', fontsize=9, color='#2980b9')
-    
-    # users -> medications (1:N)
-    ax.annotate('', xy=(9, 7.7), xytext=(3.8, 7.4),
-               arrowprops=dict(arrowstyle='->', color='#2980b9', lw=2, 
-                              connectionstyle='arc3,rad=0.2'))
-    ax.text(6, 8.3, '1:N', fontsize=9, color='#2980b9')
-    
-    # users -> user_settings (1:1)
-    ax.annotate('', xy=(2.4, 3.9), xytext=(2.4, 5.1),
-               arrowprops=dict(arrowstyle='->', color='#2980b9', lw=2))
-    ax.text(2.5, 4.5, '1:1', fontsize=9, color='#2980b9')
-    
-    # users -> med_events (1:N)
-    ax.annotate('', xy=(5, 3.9), xytext=(2.4, 5.3),
-               arrowprops=dict(arrowstyle='->', color='#2980b9', lw=2,
-                              connectionstyle='arc3,rad=-0.3'))
-    ax.text(3.2, 4.9, '1:N', fontsize=9, color='#2980b9')
-    
-    # medications -> med_events (1:N)
-    ax.annotate('', xy=(7.5, 2.8), xytext=(10.4, 4.2),
-               arrowprops=dict(arrowstyle='->', color='#e74c3c', lw=2,
-                              connectionstyle='arc3,rad=0.3'))
-    ax.text(9.5, 3.2, '1:N', fontsize=9, color='#e74c3c')
+    # Draw relationships from one table, with identical text kwargs so the
+    # repeated 1:1/1:N labels share matplotlib's glyph-layout cache
+    relationships = [
+        # (arrow xy, arrow xytext, connectionstyle, label xy, label, color)
+        ((5, 7.7), (3.8, 7.7), None, (4.4, 7.85), '1:1', '#2980b9'),    # users -> user_profiles
+        ((9, 7.7), (3.8, 7.4), 'arc3,rad=0.2', (6, 8.3), '1:N', '#2980b9'),   # users -> medications
+        ((2.4, 3.9), (2.4, 5.1), None, (2.5, 4.5), '1:1', '#2980b9'),   # users -> user_settings
+        ((5, 3.9), (2.4, 5.3), 'arc3,rad=-0.3', (3.2, 4.9), '1:N', '#2980b9'),  # users -> med_events
+        ((7.5, 2.8), (10.4, 4.2), 'arc3,rad=0.3', (9.5, 3.2), '1:N', '#e74c3c'),  # medications -> med_events
+    ]
+    for xy, xytext, connection, label_xy, label, color in relationships:
+        ax.annotate('', xy=xy, xytext=xytext,
+                   arrowprops=dict(arrowstyle='->', color=color, lw=2,
+                                  connectionstyle=connection))
+        ax.text(label_xy[0], label_xy[1], label, fontsize=9, color=color)
     
     # Legend
     legend_elements = [
@@ -475,10 +539,8 @@ def generate_er_diagram():
     ax.set_title('PostgreSQL Database Schema - Entity Relationship Diagram', 
                 fontsize=14, fontweight='bold', y=1.02)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, '06_er_diagram.png'), dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, '06_er_diagram.png'), **SAVE_KWARGS)
+    plt.close(fig)
     print("✓ Generated: 06_er_diagram.png")
 
 # =============================================================================
@@ -486,6 +548,8 @@ def generate_er_diagram():
 # =============================================================================
 def generate_websocket_sequence():
     """Generate WebSocket notification sequence diagram"""
+    if _up_to_date('07_websocket_sequence.png'):
+        return
     fig, ax = plt.subplots(figsize=(14, 10))
     
     # Actors
@@ -498,7 +562,7 @@ def generate_websocket_sequence():
         box = FancyBboxPatch((x-0.8, 9), 1.6, 0.6, boxstyle="round,pad=0.02",
                             facecolor='#3498db', edgecolor='black', linewidth=2)
         ax.add_patch(box)
-        ax.text(x, 9.3, name, ha='center', va='center', fontsize=10, 
+        ax.text(x, 9.3, name, ha='center', va='center', 
                 fontweight='bold', color='white')
         
         # Lifeline
@@ -559,7 +623,7 @@ def generate_websocket_sequence():
     legend_box = FancyBboxPatch((0.2, 1.2), 3, 1.5, boxstyle="round,pad=0.05",
                                facecolor='#f8f9fa', edgecolor='gray', linewidth=1)
     ax.add_patch(legend_box)
-    ax.text(1.7, 2.5, 'Legend:', fontsize=10, fontweight='bold')
+    ax.text(1.7, 2.5, 'Legend:', fontweight='bold')
     ax.plot([0.4, 1.2], [2.2, 2.2], color='#2980b9', lw=2)
     ax.text(1.4, 2.2, 'HTTP Request', fontsize=9, va='center')
     ax.plot([0.4, 1.2], [1.9, 1.9], color='#8e44ad', lw=2)
@@ -573,10 +637,8 @@ def generate_websocket_sequence():
     ax.set_title('Real-Time Sync: PostgreSQL NOTIFY → WebSocket Broadcast', 
                 fontsize=14, fontweight='bold', y=1.02)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, '07_websocket_sequence.png'), dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, '07_websocket_sequence.png'), **SAVE_KWARGS)
+    plt.close(fig)
     print("✓ Generated: 07_websocket_sequence.png")
 
 # =============================================================================
@@ -584,6 +646,8 @@ def generate_websocket_sequence():
 # =============================================================================
 def generate_label_capture_mockup():
     """Generate LabelCaptureScreen mockup with green targeting box"""
+    if _up_to_date('08_label_capture_screen.png'):
+        return
     fig, ax = plt.subplots(figsize=(6, 12))
     
     # Phone frame
@@ -611,27 +675,29 @@ def generate_label_capture_mockup():
                            edgecolor='#2ecc71', linewidth=4, linestyle='-')
     ax.add_patch(target_box)
     
-    # Corner brackets for targeting box
+    # Corner brackets for targeting box - the eight L-arm segments go into
+    # one LineCollection artist instead of eight ax.plot calls
     bracket_len = 0.08
-    bracket_color = '#2ecc71'
-    bracket_width = 4
-    # Top-left
-    ax.plot([0.15, 0.15 + bracket_len], [0.7, 0.7], color=bracket_color, lw=bracket_width)
-    ax.plot([0.15, 0.15], [0.7, 0.7 - bracket_len], color=bracket_color, lw=bracket_width)
-    # Top-right
-    ax.plot([0.85 - bracket_len, 0.85], [0.7, 0.7], color=bracket_color, lw=bracket_width)
-    ax.plot([0.85, 0.85], [0.7, 0.7 - bracket_len], color=bracket_color, lw=bracket_width)
-    # Bottom-left
-    ax.plot([0.15, 0.15 + bracket_len], [0.35, 0.35], color=bracket_color, lw=bracket_width)
-    ax.plot([0.15, 0.15], [0.35, 0.35 + bracket_len], color=bracket_color, lw=bracket_width)
-    # Bottom-right
-    ax.plot([0.85 - bracket_len, 0.85], [0.35, 0.35], color=bracket_color, lw=bracket_width)
-    ax.plot([0.85, 0.85], [0.35, 0.35 + bracket_len], color=bracket_color, lw=bracket_width)
+    bracket_segments = [
+        # Top-left
+        [(0.15, 0.7), (0.15 + bracket_len, 0.7)],
+        [(0.15, 0.7), (0.15, 0.7 - bracket_len)],
+        # Top-right
+        [(0.85 - bracket_len, 0.7), (0.85, 0.7)],
+        [(0.85, 0.7), (0.85, 0.7 - bracket_len)],
+        # Bottom-left
+        [(0.15, 0.35), (0.15 + bracket_len, 0.35)],
+        [(0.15, 0.35), (0.15, 0.35 + bracket_len)],
+        # Bottom-right
+        [(0.85 - bracket_len, 0.35), (0.85, 0.35)],
+        [(0.85, 0.35), (0.85, 0.35 + bracket_len)],
+    ]
+    ax.add_collection(LineCollection(bracket_segments, colors='#2ecc71', linewidths=4))
     
     # Instruction text at top
     ax.text(0.5, 0.88, 'Scan Medication Label', ha='center', fontsize=12, 
             fontweight='bold', color='white')
-    ax.text(0.5, 0.82, 'Align label within green box', ha='center', fontsize=10, color='#bdc3c7')
+    ax.text(0.5, 0.82, 'Align label within green box', ha='center', color='#bdc3c7')
     
     # Capture button at bottom
     capture_btn = Circle((0.5, 0.12), 0.06, facecolor='white', edgecolor='#2ecc71', linewidth=4)
@@ -648,10 +714,8 @@ def generate_label_capture_mockup():
     ax.set_aspect(2)  # Phone aspect ratio
     ax.axis('off')
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, '08_label_capture_screen.png'), dpi=150, bbox_inches='tight',
-                facecolor='#1a1a1a', edgecolor='none')
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, '08_label_capture_screen.png'), **{**SAVE_KWARGS, 'facecolor': '#1a1a1a'})
+    plt.close(fig)
     print("✓ Generated: 08_label_capture_screen.png")
 
 # =============================================================================
@@ -659,6 +723,8 @@ def generate_label_capture_mockup():
 # =============================================================================
 def generate_system_architecture():
     """Generate complete system architecture diagram"""
+    if _up_to_date('09_system_architecture.png'):
+        return
     fig, ax = plt.subplots(figsize=(16, 10))
     
     def draw_component(x, y, width, height, name, subtitle='', color='#3498db'):
@@ -747,10 +813,8 @@ def generate_system_architecture():
     ax.axis('off')
     ax.set_title('Med OCR System Architecture', fontsize=16, fontweight='bold', y=1.02)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, '09_system_architecture.png'), dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, '09_system_architecture.png'), **SAVE_KWARGS)
+    plt.close(fig)
     print("✓ Generated: 09_system_architecture.png")
 
 # =============================================================================
@@ -758,6 +822,8 @@ def generate_system_architecture():
 # =============================================================================
 def generate_service_layer():
     """Generate three-tier service layer diagram"""
+    if _up_to_date('10_service_layer.png'):
+        return
     fig, ax = plt.subplots(figsize=(12, 8))
     
     # UI Layer
@@ -767,7 +833,7 @@ def generate_service_layer():
     ax.text(6, 6.6, 'UI Components', ha='center', va='center', fontsize=14, 
             fontweight='bold', color='white')
     ax.text(6, 6.2, 'LoginScreen | SignUpScreen | DashboardScreen | MedicationReviewScreen', 
-            ha='center', fontsize=10, color='white', alpha=0.9)
+            ha='center', color='white', alpha=0.9)
     
     # Service Layer boxes
     services = [
@@ -790,7 +856,7 @@ def generate_service_layer():
     ax.add_patch(infra_box)
     ax.text(6, 1.6, 'Infrastructure', ha='center', va='center', fontsize=14, 
             fontweight='bold', color='white')
-    ax.text(6, 1.2, 'AsyncStorage | Fetch API | WebSocket', ha='center', fontsize=10, 
+    ax.text(6, 1.2, 'AsyncStorage | Fetch API | WebSocket', ha='center', 
             color='white', alpha=0.9)
     
     # Arrows from UI to Services
@@ -810,45 +876,59 @@ def generate_service_layer():
                arrowprops=dict(arrowstyle='<->', color='gray', lw=1.5, linestyle='--'))
     
     # Layer labels
-    ax.text(0.3, 6.6, 'View\nLayer', ha='center', va='center', fontsize=10, fontweight='bold')
-    ax.text(0.3, 4.4, 'Service\nLayer', ha='center', va='center', fontsize=10, fontweight='bold')
-    ax.text(0.3, 1.6, 'Infra\nLayer', ha='center', va='center', fontsize=10, fontweight='bold')
+    ax.text(0.3, 6.6, 'View\nLayer', ha='center', va='center', fontweight='bold')
+    ax.text(0.3, 4.4, 'Service\nLayer', ha='center', va='center', fontweight='bold')
+    ax.text(0.3, 1.6, 'Infra\nLayer', ha='center', va='center', fontweight='bold')
     
     ax.set_xlim(-0.5, 12)
     ax.set_ylim(0, 8)
     ax.axis('off')
     ax.set_title('Three-Tier Service Architecture', fontsize=14, fontweight='bold', y=1.02)
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, '10_service_layer.png'), dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
+    plt.savefig(os.path.join(OUTPUT_DIR, '10_service_layer.png'), **SAVE_KWARGS)
+    plt.close(fig)
     print("✓ Generated: 10_service_layer.png")
 
 # =============================================================================
 # Main execution
 # =============================================================================
+# Figures to generate, in numbering order
+GENERATORS = [
+    'preprocessing_comparison',
+    'otsu_histogram',
+    'crop_region_diagram',
+    'ocr_flowchart',
+    'perspective_correction',
+    'er_diagram',
+    'websocket_sequence',
+    'label_capture_mockup',
+    'system_architecture',
+    'service_layer',
+]
+
+def _invoke(name):
+    """Run one generator in a worker process (each gets its own pyplot state)"""
+    # Interactive mode off skips the draw-on-change event hooks, and each
+    # figure is closed by handle so Gcf never has to scan its registry
+    with plt.ioff():
+        set_style()
+        globals()[f'generate_{name}']()
+
 if __name__ == '__main__':
+    from concurrent.futures import ProcessPoolExecutor
+
     print("=" * 50)
     print("Generating Lab Notebook Images...")
     print("=" * 50)
     print(f"Output directory: {OUTPUT_DIR}")
     print()
-    
-    set_style()
-    
-    # Generate all images
-    generate_preprocessing_comparison()
-    generate_otsu_histogram()
-    generate_crop_region_diagram()
-    generate_ocr_flowchart()
-    generate_perspective_correction()
-    generate_er_diagram()
-    generate_websocket_sequence()
-    generate_label_capture_mockup()
-    generate_system_architecture()
-    generate_service_layer()
-    
+
+    # The generators are independent (one figure, one PNG each), so fan
+    # them out across processes; pyplot state is process-global, which
+    # rules out threads.
+    with ProcessPoolExecutor(max_workers=min(len(GENERATORS), os.cpu_count() or 1)) as ex:
+        list(ex.map(_invoke, GENERATORS))
+
     print()
     print("=" * 50)
     print("All images generated successfully!")
@@ -20,6 +20,7 @@ import { clearAuthSession } from './storage/secureStorage';
 import { getCurrentUserKey, signOut as authSignOut } from './AuthService';
 import AsyncStorage from '@react-native-async-storage/async-storage';
 import { unsubscribeAll } from './RealtimeService';
+import { invalidateMedicationsCache } from './storage/medications';
 
 export interface DeletionResult {
   success: boolean;
@@ -145,7 +146,10 @@ export async function deleteAccountAndAllData(): Promise<DeletionResult> {
       if (keys.length > 0) {
         await AsyncStorage.multiRemove(keys);
       }
-      
+      // Drop the in-memory medication cache too - the same user key is
+      // reused on re-sign-in, so a stale cache would resurrect deleted data
+      invalidateMedicationsCache();
+
       result.deletedItems.localData = true;
     } catch (e) {
       result.errors.push(`Local storage clear exception: ${e}`);
@@ -59,6 +59,7 @@ import { supabase } from '@config/supabase';
 import { Session, User, AuthChangeEvent } from '@supabase/supabase-js';
 import { unsubscribeAll } from './RealtimeService';
 import AsyncStorage from '@react-native-async-storage/async-storage';
+import { invalidateMedicationsCache } from './storage/medications';
 
 // Type for auth state change callbacks
 type AuthStateCallback = (event: AuthChangeEvent, session: Session | null) => void;
@@ -256,6 +257,9 @@ async function handleSignOut(): Promise<void> {
     ];
     
     await AsyncStorage.multiRemove(keysToRemove);
+    // The '@medications' key was removed directly, so drop the in-memory
+    // mirror as well
+    invalidateMedicationsCache();
     console.log('✅ Cleared AsyncStorage user data');
 
     // Note: SecureStore tokens are managed by Supabase Auth adapter
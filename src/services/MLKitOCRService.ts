@@ -31,7 +31,10 @@ export interface ScanProgress {
 export interface AccumulatedText {
   allText: string;
   uniqueLines: Set<string>;
-  blockConfidences: number[];
+  // Running sum/count of per-frame confidence estimates; only the mean is
+  // ever consumed, so the individual samples are not retained
+  confidenceSum: number;
+  confidenceCount: number;
   lastUpdateTime: number;
 }
 
@@ -66,7 +69,8 @@ class MLKitOCRServiceClass {
   private accumulatedText: AccumulatedText = {
     allText: '',
     uniqueLines: new Set(),
-    blockConfidences: [],
+    confidenceSum: 0,
+    confidenceCount: 0,
     lastUpdateTime: Date.now(),
   };
 
@@ -74,6 +78,16 @@ class MLKitOCRServiceClass {
   private lastTextSnapshot: string = '';
   private stableTextTime: number = 0;
 
+  // Memoized result of the last detectFields() run, so assessQuality() after
+  // processFrameText() doesn't re-run all ten field regexes on the same text
+  private lastDetectedText: string | null = null;
+  private lastDetectedFields: string[] = [];
+
+  // Raw text of the previously processed frame; consecutive identical frames
+  // (common once the camera steadies) skip line cleaning and re-scoring
+  private lastRawFrameText: string | null = null;
+  private lastFrameConfidence: number = 0;
+
   /**
    * Reset the accumulated text for a new scan session
    */
@@ -81,12 +95,17 @@ class MLKitOCRServiceClass {
     this.accumulatedText = {
       allText: '',
       uniqueLines: new Set(),
-      blockConfidences: [],
+      confidenceSum: 0,
+      confidenceCount: 0,
       lastUpdateTime: Date.now(),
     };
     this.scanStartTime = Date.now();
     this.lastTextSnapshot = '';
     this.stableTextTime = 0;
+    this.lastDetectedText = null;
+    this.lastDetectedFields = [];
+    this.lastRawFrameText = null;
+    this.lastFrameConfidence = 0;
   }
 
   /**
@@ -109,22 +128,34 @@ class MLKitOCRServiceClass {
    */
   processFrameText(result: TextRecognitionResult): ScanProgress {
     const now = Date.now();
-    
-    // Extract and clean lines from this frame
-    const newLines = this.extractCleanLines(result);
-    
-    // Add new unique lines
-    let addedNew = false;
-    for (const line of newLines) {
-      if (!this.accumulatedText.uniqueLines.has(line)) {
-        this.accumulatedText.uniqueLines.add(line);
-        addedNew = true;
+
+    const rawFrameText = result.blocks.map(block => block.text).join('\n');
+    let confidence: number;
+
+    if (rawFrameText === this.lastRawFrameText) {
+      // Identical frame: cleaning and scoring would reproduce the previous
+      // result, so reuse it and fall through to the stability tracking below
+      confidence = this.lastFrameConfidence;
+    } else {
+      // Extract and clean lines from this frame
+      const newLines = this.extractCleanLines(result);
+
+      // Add new unique lines
+      let addedNew = false;
+      for (const line of newLines) {
+        if (!this.accumulatedText.uniqueLines.has(line)) {
+          this.accumulatedText.uniqueLines.add(line);
+          addedNew = true;
+        }
       }
-    }
 
-    // Track block confidences (ML Kit doesn't provide confidence, estimate from structure)
-    const confidence = this.estimateConfidence(result);
-    this.accumulatedText.blockConfidences.push(confidence);
+      // Track block confidences (ML Kit doesn't provide confidence, estimate from structure)
+      confidence = this.estimateConfidence(result);
+      this.lastRawFrameText = rawFrameText;
+      this.lastFrameConfidence = confidence;
+    }
+    this.accumulatedText.confidenceSum += confidence;
+    this.accumulatedText.confidenceCount += 1;
 
     // Update accumulated text
     this.accumulatedText.allText = Array.from(this.accumulatedText.uniqueLines).join('\n');
@@ -212,6 +243,10 @@ class MLKitOCRServiceClass {
    * Detect which medication fields have been found in the text
    */
   private detectFields(text: string): string[] {
+    if (text === this.lastDetectedText) {
+      return this.lastDetectedFields;
+    }
+
     const detected: string[] = [];
 
     if (MEDICATION_PATTERNS.PATIENT_NAME.test(text)) detected.push('patientName');
@@ -225,6 +260,8 @@ class MLKitOCRServiceClass {
     if (MEDICATION_PATTERNS.DATE.test(text)) detected.push('date');
     if (MEDICATION_PATTERNS.PHONE.test(text)) detected.push('phone');
 
+    this.lastDetectedText = text;
+    this.lastDetectedFields = detected;
     return detected;
   }
 
@@ -236,9 +273,8 @@ class MLKitOCRServiceClass {
     const textLength = this.accumulatedText.allText.length;
     
     // Calculate average confidence
-    const avgConfidence = this.accumulatedText.blockConfidences.length > 0
-      ? this.accumulatedText.blockConfidences.reduce((a, b) => a + b, 0) / 
-        this.accumulatedText.blockConfidences.length
+    const avgConfidence = this.accumulatedText.confidenceCount > 0
+      ? this.accumulatedText.confidenceSum / this.accumulatedText.confidenceCount
       : 0;
 
     // Check completion criteria
@@ -301,9 +337,8 @@ class MLKitOCRServiceClass {
       uniqueLines: this.accumulatedText.uniqueLines.size,
       totalChars: this.accumulatedText.allText.length,
       scanDuration: Date.now() - this.scanStartTime,
-      avgConfidence: this.accumulatedText.blockConfidences.length > 0
-        ? this.accumulatedText.blockConfidences.reduce((a, b) => a + b, 0) / 
-          this.accumulatedText.blockConfidences.length
+      avgConfidence: this.accumulatedText.confidenceCount > 0
+        ? this.accumulatedText.confidenceSum / this.accumulatedText.confidenceCount
         : 0,
     };
   }
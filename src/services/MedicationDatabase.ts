@@ -14,6 +14,31 @@ export class MedicationDatabase {
   private static cacheTimestamp: number = 0;
   private static readonly CACHE_DURATION = 24 * 60 * 60 * 1000; // 24 hours
 
+  // Word splits derived from medicationCache, computed once per refresh so
+  // matching loops don't re-split every database entry on every call
+  private static medicationWordsCache: Array<{
+    medication: string;
+    firstWord: string;
+    secondWord?: string;
+  }> | null = null;
+
+  // First medication per 4-character prefix, so the prefix fallback in
+  // findClosestMedication is a single Map lookup instead of a scan over
+  // the whole database
+  private static medicationPrefixCache: Map<string, string> | null = null;
+  private static readonly PREFIX_LENGTH = 4;
+
+  // Memoized isMedication verdicts - the same tokens recur across the lines
+  // and frames of a single scan, and each miss costs a fuzzy database pass.
+  // Cleared whenever the medication cache refreshes.
+  private static medicationCheckCache: Map<string, boolean> = new Map();
+  private static readonly CHECK_CACHE_MAX = 512;
+
+  // Memoized findClosestMedication results keyed by the normalized input,
+  // so re-scans of the same label skip the two-stage fuzzy search entirely.
+  // Cleared whenever the medication cache refreshes.
+  private static closestMatchCache: Map<string, string | undefined> = new Map();
+
   // Common medication forms
   static readonly MEDICATION_FORMS = new Set([
     'TABLET', 'TABLETS', 'CAPSULE', 'CAPSULES', 'PILL', 'PILLS',
@@ -218,8 +243,14 @@ export class MedicationDatabase {
     return Date.now() - this.cacheTimestamp < this.CACHE_DURATION;
   }
 
+  // In-flight refresh shared by all callers, so concurrent parses trigger at
+  // most one fetch whether the cache is merely expired or completely cold
+  private static refreshInFlight: Promise<void> | null = null;
+
   /**
    * Refresh cache from online sources
+   * An expired-but-present cache is served as-is while a refresh runs in the
+   * background; only a completely cold cache blocks the caller
    */
   private static async refreshCache(): Promise<void> {
     if (this.isCacheValid()) {
@@ -227,6 +258,34 @@ export class MedicationDatabase {
       return; // Cache still valid
     }
 
+    const hasStaleData =
+      this.medicationCache && this.firstNameCache && this.lastNameCache;
+
+    if (!this.refreshInFlight) {
+      if (hasStaleData) {
+        console.log('📦 Cache expired - refreshing in background, serving stale data');
+      }
+      this.refreshInFlight = this.fetchAndStoreCaches().finally(() => {
+        this.refreshInFlight = null;
+      });
+      if (hasStaleData) {
+        // Keep serving stale data; the next expired call retries on failure
+        this.refreshInFlight.catch(error => {
+          console.error('⚠️ Background database refresh failed:', error);
+        });
+      }
+    }
+
+    if (!hasStaleData) {
+      // Cold cache: every waiting caller joins the same fetch
+      await this.refreshInFlight;
+    }
+  }
+
+  /**
+   * Fetch all databases and swap them into the cache
+   */
+  private static async fetchAndStoreCaches(): Promise<void> {
     console.log('🔄 Fetching medication databases from online sources...');
     try {
       // Fetch all databases in parallel
@@ -240,6 +299,10 @@ export class MedicationDatabase {
       this.firstNameCache = firstNames;
       this.lastNameCache = lastNames;
       this.cacheTimestamp = Date.now();
+      this.medicationWordsCache = this.buildMedicationWords(medications);
+      this.medicationPrefixCache = this.buildMedicationPrefixes(medications);
+      this.medicationCheckCache.clear();
+      this.closestMatchCache.clear();
 
       console.log('Database cache refreshed:', {
         medications: medications.size,
@@ -263,6 +326,66 @@ export class MedicationDatabase {
     return this.medicationCache;
   }
 
+  /**
+   * Split each medication into its first/second words once per refresh
+   */
+  private static buildMedicationWords(
+    medications: Set<string>,
+  ): Array<{medication: string; firstWord: string; secondWord?: string}> {
+    const entries: Array<{medication: string; firstWord: string; secondWord?: string}> = [];
+    for (const med of medications) {
+      const words = med.split(/\s+/).filter(w => w.length > 0);
+      if (words.length > 0) {
+        entries.push({
+          medication: med,
+          firstWord: words[0],
+          secondWord: words.length > 1 ? words[1] : undefined,
+        });
+      }
+    }
+    return entries;
+  }
+
+  /**
+   * Get pre-split medication words (with online refresh)
+   */
+  private static async getMedicationWords(): Promise<
+    Array<{medication: string; firstWord: string; secondWord?: string}>
+  > {
+    const medications = await this.getMedications();
+    if (!this.medicationWordsCache) {
+      this.medicationWordsCache = this.buildMedicationWords(medications);
+    }
+    return this.medicationWordsCache;
+  }
+
+  /**
+   * Index the first medication found for each 4-character prefix
+   */
+  private static buildMedicationPrefixes(medications: Set<string>): Map<string, string> {
+    const prefixes = new Map<string, string>();
+    for (const med of medications) {
+      if (med.length >= this.PREFIX_LENGTH) {
+        const prefix = med.substring(0, this.PREFIX_LENGTH);
+        if (!prefixes.has(prefix)) {
+          prefixes.set(prefix, med);
+        }
+      }
+    }
+    return prefixes;
+  }
+
+  /**
+   * Get the medication prefix index (with online refresh)
+   */
+  private static async getMedicationPrefixes(): Promise<Map<string, string>> {
+    const medications = await this.getMedications();
+    if (!this.medicationPrefixCache) {
+      this.medicationPrefixCache = this.buildMedicationPrefixes(medications);
+    }
+    return this.medicationPrefixCache;
+  }
+
   /**
    * Get first names (with online refresh)
    */
@@ -344,27 +467,47 @@ export class MedicationDatabase {
       return false;
     }
     
+    const cached = this.medicationCheckCache.get(normalized);
+    if (cached !== undefined) {
+      return cached;
+    }
+
     const medications = await this.getMedications();
     console.log(`🔍 Checking if "${word}" is a medication (${medications.size} drugs in database)`);
-    
+
     // Exact match - immediate return
     if (medications.has(normalized)) {
       console.log(`✓ Exact match: "${word}" is a medication`);
-      return true;
+      return this.rememberMedicationCheck(normalized, true);
     }
-    
+
     // Fuzzy match with 90% similarity threshold
     // OPTIMIZATION: Early exit as soon as we find a match
     for (const med of medications) {
+      if (this.similarityUpperBound(normalized, med) < 90) continue;
       const similarity = this.calculateSimilarity(normalized, med);
       if (similarity >= 90) {
         console.log(`✓ Fuzzy matched medication: "${word}" ~= "${med}" (${similarity.toFixed(1)}% similar)`);
-        return true; // Early exit - no need to check remaining medications
+        return this.rememberMedicationCheck(normalized, true); // Early exit
       }
     }
-    
+
     console.log(`⚠️ "${word}" not a medication (highest similarity < 90%)`);
-    return false;
+    return this.rememberMedicationCheck(normalized, false);
+  }
+
+  /**
+   * Record an isMedication verdict, evicting the oldest entry when full
+   */
+  private static rememberMedicationCheck(word: string, verdict: boolean): boolean {
+    if (this.medicationCheckCache.size >= this.CHECK_CACHE_MAX) {
+      const oldest = this.medicationCheckCache.keys().next().value;
+      if (oldest !== undefined) {
+        this.medicationCheckCache.delete(oldest);
+      }
+    }
+    this.medicationCheckCache.set(word, verdict);
+    return verdict;
   }
 
   /**
@@ -405,6 +548,7 @@ export class MedicationDatabase {
     
     // Fuzzy match with 85% similarity threshold
     for (const name of names) {
+      if (this.similarityUpperBound(normalized, name) < 85) continue;
       const similarity = this.calculateSimilarity(normalized, name);
       if (similarity >= 85) {
         console.log(`✓ Fuzzy matched first name: "${word}" ~= "${name}" (${similarity.toFixed(1)}% similar)`);
@@ -445,6 +589,7 @@ export class MedicationDatabase {
     
     // Fuzzy match with 85% similarity threshold
     for (const name of names) {
+      if (this.similarityUpperBound(normalized, name) < 85) continue;
       const similarity = this.calculateSimilarity(normalized, name);
       if (similarity >= 85) {
         console.log(`✓ Fuzzy matched last name: "${word}" ~= "${name}" (${similarity.toFixed(1)}% similar)`);
@@ -495,12 +640,15 @@ export class MedicationDatabase {
    */
   static async findClosestMedication(input: string): Promise<string | undefined> {
     const normalized = input.toUpperCase().replace(/[^A-Z\s]/g, '').trim();
+    if (this.closestMatchCache.has(normalized)) {
+      return this.closestMatchCache.get(normalized);
+    }
     const medications = await this.getMedications();
-    
+
     // Exact match first
     if (medications.has(normalized)) {
       console.log(`✓ Exact medication match: "${input}" = "${normalized}"`);
-      return normalized;
+      return this.rememberClosestMatch(normalized, normalized);
     }
     
     // Split input into words
@@ -511,18 +659,18 @@ export class MedicationDatabase {
     console.log(`🔍 Two-stage matching: first="${firstWord}", second="${secondWord || '(none)'}"`);
     
     // Stage 1: Find medications where first word matches >= 90%
-    const firstWordMatches: Array<{medication: string, firstSimilarity: number}> = [];
-    
-    for (const med of medications) {
-      const medWords = med.split(/\s+/).filter(w => typeof w === 'string' && w.length > 0);
-      const medFirstWord = medWords[0];
-      
-      const similarity = this.calculateSimilarity(firstWord, medFirstWord);
-      
+    const medicationWords = await this.getMedicationWords();
+    const firstWordMatches: Array<{medication: string, firstSimilarity: number, secondWord?: string}> = [];
+
+    for (const entry of medicationWords) {
+      if (this.similarityUpperBound(firstWord, entry.firstWord) < 90) continue;
+      const similarity = this.calculateSimilarity(firstWord, entry.firstWord);
+
       if (similarity >= 90) {
         firstWordMatches.push({
-          medication: med,
-          firstSimilarity: similarity
+          medication: entry.medication,
+          firstSimilarity: similarity,
+          secondWord: entry.secondWord
         });
       }
     }
@@ -531,17 +679,16 @@ export class MedicationDatabase {
       console.log(`⚠️ No first word match found (need >= 90% similarity for "${firstWord}")`);
       
       // Fallback: Look for medications that start with the same prefix (at least 4 chars)
-      if (typeof firstWord === 'string' && firstWord.length >= 4) {
-        const prefix = firstWord.substring(0, 4);
-        for (const med of medications) {
-          if (med.startsWith(prefix)) {
-            console.log(`✓ Prefix matched medication: "${input}" ~= "${med}" (prefix: ${prefix})`);
-            return med;
-          }
+      if (typeof firstWord === 'string' && firstWord.length >= this.PREFIX_LENGTH) {
+        const prefix = firstWord.substring(0, this.PREFIX_LENGTH);
+        const prefixMatch = (await this.getMedicationPrefixes()).get(prefix);
+        if (prefixMatch) {
+          console.log(`✓ Prefix matched medication: "${input}" ~= "${prefixMatch}" (prefix: ${prefix})`);
+          return this.rememberClosestMatch(normalized, prefixMatch);
         }
       }
-      
-      return undefined;
+
+      return this.rememberClosestMatch(normalized, undefined);
     }
     
     console.log(`✓ Found ${Array.isArray(firstWordMatches) ? firstWordMatches.length : 0} medication(s) with first word >= 90% match`);
@@ -553,11 +700,8 @@ export class MedicationDatabase {
       let bestFirstSimilarity = 0;
       
       for (const match of firstWordMatches) {
-        const medWords = match.medication.split(/\s+/).filter(w => typeof w === 'string' && w.length > 0);
-        
-        if (Array.isArray(medWords) && medWords.length > 1) {
-          const medSecondWord = medWords[1];
-          const secondSimilarity = this.calculateSimilarity(secondWord, medSecondWord);
+        if (match.secondWord) {
+          const secondSimilarity = this.calculateSimilarity(secondWord, match.secondWord);
           
           console.log(`  📊 "${match.medication}": first=${match.firstSimilarity.toFixed(1)}%, second=${secondSimilarity.toFixed(1)}%`);
           
@@ -586,11 +730,11 @@ export class MedicationDatabase {
         } else {
           console.log(`✓ Single-word match: "${input}" -> "${bestMatch}" (first: ${bestFirstSimilarity.toFixed(1)}%)`);
         }
-        return bestMatch;
+        return this.rememberClosestMatch(normalized, bestMatch);
       }
-      
+
       console.log(`⚠️ No second word match found (need >= 10% similarity for "${secondWord}")`);
-      return undefined;
+      return this.rememberClosestMatch(normalized, undefined);
     }
     
     // No second word in input - return best first word match
@@ -599,38 +743,64 @@ export class MedicationDatabase {
     );
     
     console.log(`✓ Single-word match: "${input}" -> "${bestMatch.medication}" (${bestMatch.firstSimilarity.toFixed(1)}%)`);
-    return bestMatch.medication;
+    return this.rememberClosestMatch(normalized, bestMatch.medication);
+  }
+
+  /**
+   * Store a findClosestMedication result, evicting the oldest entry at capacity
+   */
+  private static rememberClosestMatch(key: string, match: string | undefined): string | undefined {
+    if (this.closestMatchCache.size >= this.CHECK_CACHE_MAX) {
+      const oldest = this.closestMatchCache.keys().next().value;
+      if (oldest !== undefined) {
+        this.closestMatchCache.delete(oldest);
+      }
+    }
+    this.closestMatchCache.set(key, match);
+    return match;
   }
 
   /**
    * Calculate Levenshtein distance between two strings
+   * Keeps only the previous and current matrix rows instead of the full
+   * (m+1)×(n+1) matrix, since each cell only depends on those two rows
    */
   private static levenshteinDistance(str1: string, str2: string): number {
-    const matrix: number[][] = [];
-
-    for (let i = 0; i <= str2.length; i++) {
-      matrix[i] = [i];
-    }
+    let prevRow = new Array<number>(str1.length + 1);
+    let currRow = new Array<number>(str1.length + 1);
 
     for (let j = 0; j <= str1.length; j++) {
-      matrix[0][j] = j;
+      prevRow[j] = j;
     }
 
     for (let i = 1; i <= str2.length; i++) {
+      currRow[0] = i;
       for (let j = 1; j <= str1.length; j++) {
         if (str2.charAt(i - 1) === str1.charAt(j - 1)) {
-          matrix[i][j] = matrix[i - 1][j - 1];
+          currRow[j] = prevRow[j - 1];
         } else {
-          matrix[i][j] = Math.min(
-            matrix[i - 1][j - 1] + 1, // substitution
-            matrix[i][j - 1] + 1,     // insertion
-            matrix[i - 1][j] + 1      // deletion
+          currRow[j] = Math.min(
+            prevRow[j - 1] + 1, // substitution
+            currRow[j - 1] + 1, // insertion
+            prevRow[j] + 1      // deletion
           );
         }
       }
+      [prevRow, currRow] = [currRow, prevRow];
     }
 
-    return matrix[str2.length][str1.length];
+    return prevRow[str1.length];
+  }
+
+  /**
+   * Cheap upper bound on calculateSimilarity: the length difference alone
+   * forces at least that many edits, so candidates that cannot possibly
+   * reach a threshold can be skipped without running the full distance loop
+   */
+  private static similarityUpperBound(str1: string, str2: string): number {
+    const maxLength = Math.max(str1.length, str2.length);
+    if (maxLength === 0) return 100;
+    return ((maxLength - Math.abs(str1.length - str2.length)) / maxLength) * 100;
   }
 
   /**
@@ -1,6 +1,138 @@
 import {ParsedMedicationData} from '@types';
 import {MedicationDatabase} from './MedicationDatabase';
 
+/**
+ * Known retail pharmacy chains, compiled once as a single alternation so the
+ * fallback scan is one regex pass instead of building a RegExp per chain name
+ * on every call
+ */
+const COMMON_PHARMACY_REGEX = /\b(WALGREENS|CVS|WALMART|RITE\s*AID|KROGER|SAFEWAY|PUBLIX|TARGET|COSTCO|SAM'S\s*CLUB|H[\s-]?E[\s-]?B)\b/i;
+
+/**
+ * Parse-trace logging runs once per extracted field on every scanned frame;
+ * keep it in dev builds but off the release hot path (console calls cross
+ * the bridge and serialize their arguments). Warnings/errors stay unconditional.
+ */
+const debugLog = __DEV__ ? console.log.bind(console) : (..._args: unknown[]) => {};
+
+/**
+ * Field-extraction patterns, hoisted to module scope so each per-frame parse
+ * reuses the compiled regexes instead of rebuilding the arrays on every call
+ */
+const DOSAGE_PATTERNS = [
+  // Look for "1 TABLET", "2 CAPSULES", "1 CAPSULE" etc. - most specific first
+  /(?:take|give|swallow|inject)\s*["']?[^"']*["']?\s*(\d+(?:\.\d+)?\s*(?:tablet|capsule|pill)s?)/i,
+  /(\d+(?:\.\d+)?\s*(?:tablet|capsule|pill)s?)\s*by\s*mouth/i,
+  /(\d+(?:\.\d+)?\s*(?:tablet|capsule|pill)s?)/i,
+];
+
+const FREQUENCY_PATTERNS = [
+  // Most specific patterns first - prioritize "TWICE DAILY" over generic
+  /(?:by\s+)?mouth\s+(once|twice|three times|four times)\s*(?:per\s+day|daily|dai[ly)]?|py|dal)/i,
+  /(once|twice|three times|four times)\s*(?:per|a|each)?\s*(?:day|daily|dai[ly)]?|py|dal)/i,
+  /(?:take|use)\s+(\d+\s*times?\s*(?:per|a|each)\s*day)/i,
+  /(\d+\s*times?\s*daily)/i,
+  // Handle OCR errors: "VERY 12 HOURS" or "EVERY 12 HOURS"
+  /([ev]very\s+\d+\s*(?:to\s+\d+\s*)?hours?)/i,
+  /(every\s+(?:morning|night|evening))/i,
+  /(morning and evening|morning and night)/i,
+  /(BID|TID|QID|QD|PRN)/i,  // Medical abbreviations
+  // Generic daily/weekly/monthly - LAST priority
+  /(daily|weekly|monthly)/i,
+  // Fallback for badly OCR'd "EVERY X HOURS" pattern
+  /(\d+\s*hours?)/i,
+];
+
+const DURATION_PATTERNS = [
+  // Handle leading OCR errors: "sFOR 7 DAYS", "FOR 7 DAYS"
+  /[a-z]*for\s+(\d+\s*(?:day|week|month)s?)/i,
+  /(\d+\s*(?:day|week|month)s?)/i,
+  /(\d+\s*day\s*supply)/i,
+  /(until\s+gone|until\s+finished)/i,
+];
+
+const ROUTE_PATTERNS = [
+  /BY\s+MOUTH/i,
+  /ORALLY/i,
+  /SUBLINGUAL/i,
+  /TOPICALLY/i,
+];
+
+const MEAL_PATTERNS = [
+  /WITH\s+(?:MEALS?|FOOD)/i,
+  /AFTER\s+MEALS?/i,
+  /BEFORE\s+MEALS?/i,
+  /ON\s+(?:AN\s+)?EMPTY\s+STOMACH/i,
+];
+
+const RX_PATTERNS = [
+  /RX\s*#?\s*:?\s*([0-9-\/]+)/i,
+  /RX\s*NUMBER\s*:?\s*([0-9-\/]+)/i,
+  /PRESCRIPTION\s*#?\s*:?\s*([0-9-\/]+)/i,
+  // Handle OCR errors with leading pipes and 'x': "| x0958223-10613"
+  /[|\s]*[xX]\s*(\d{7,10}-\d{3,5})/,
+  // Handle OCR errors: "F", "%", "x", "sx" prefix before number
+  /^[FfPp%xXsS]*\s*(\d{7,10}-\d{3,5}[!\/]?\d*)/,
+  // Direct pattern: 1999830-095/74 or 1399830-0957!
+  /\b(\d{7,10}-\d{3}\/\d{1,2})/,
+  /\b(\d{7,10}-\d{4,5}[!]?)/,
+  /\b(\d{7,10})\b/,  // Just digits (fallback)
+];
+
+const QTY_PATTERNS = [
+  /QTY\s*:?\s*(\d+)/i,
+  /QUANTITY\s*:?\s*(\d+)/i,
+  /[ao0rt][y]\s*:?\s*(\d+)/i,
+  /#\s*(\d+)/,
+  /[~-]\s*(\d{1,3})\b/,
+  /\b(\d+)\s*(?:tablets?|capsules?|pills?)\b/i,
+];
+
+const REFILL_PATTERNS = [
+  /REFILLS?\s*:?\s*(\d+|none|no)/i,
+  /REFILLS?\s*REMAINING\s*:?\s*(\d+)/i,
+  /(\d+)\s*REFILLS?/i,
+  // Handle OCR errors: VREFILLS, MREFILLS, etc.
+  /[VM]REFILLS?\s*:?\s*(\d+|none|no)/i,
+];
+
+const REFILL_DATE_PATTERNS = [
+  // Handle OCR errors: NEFILLS, VEFILLS, MEFILLS instead of REFILLS
+  /(?:RE|NE|VE|ME)?FILLS?\s+BEFORE\s*:?\s*(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})/i,
+  /(?:RE|NE|VE|ME)?FILL\s+BY\s*:?\s*(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})/i,
+  /(?:RE|NE|VE|ME)?FILLS?\s+VALID\s+UNTIL\s*:?\s*(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})/i,
+  /(?:RE|NE|VE|ME)?FILLS?\s+EXPIRE\s*:?\s*(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})/i,
+];
+
+const PHARMACY_PATTERNS = [
+  /^(.+\s+PHARMACY)/i,
+  /^(.+\s+DRUG)/i,
+  /^(PHARMACY\s+.+)/i,
+  /^(CVS|WALGREENS|WALMART|RITE\s*AID|KROGER|SAFEWAY|PUBLIX)/i,
+];
+
+const PHONE_PATTERNS = [
+  // Phone with parentheses: (832) 934-0415
+  /\((\d{3})\)\s*(\d{3})[-.]?(\d{4})/,
+  // Phone without parentheses: 832-934-0415
+  /\b(\d{3})[-. ](\d{3})[-. ](\d{4})\b/,
+  // Handle partial OCR: missing opening paren like "979) 779-2006" or "1) 779-2006"
+  /(\d{1,3})\)\s*(\d{3})[-.]?(\d{4})/,
+];
+
+const INSTRUCTION_PATTERNS = [
+  /(?:take|use|apply)\s+([^.]+)/i,
+  /(?:directions|instructions):\s*([^.]+)/i,
+];
+
+// Reject regexes for parseDrugFromLine, compiled once. The street-suffix
+// alternation runs as a single scan per line instead of one membership
+// test per suffix.
+const STREET_SUFFIX_REGEX = /\b(street|st|avenue|ave|road|rd|drive|dr|boulevard|blvd|lane|ln|court|ct|circle|cir|way|place|pl|highway|hwy|parkway|pkwy)\b[,\s]|[,\s]\b(street|st|avenue|ave|road|rd|drive|dr|boulevard|blvd|lane|ln|court|ct|circle|cir|way|place|pl|highway|hwy|parkway|pkwy)\b/i;
+const LONG_DIGITS_REGEX = /\d{4,}/;
+const PHARMACY_INFO_REGEX = /pharmacy|take\s+\d|tablet|capsule|by mouth|meal|hour|day|refill|dr\.\s*auth/i;
+const MANUFACTURER_REGEX = /^(mfg|manuf|manufacturer)/i;
+
 /**
  * OCR Service - Parses prescription label text and extracts medication information
  */
@@ -26,13 +158,13 @@ export class OCRService {
     
     // Remove all lines before patient name and reindex
     if (patientLineIndex > 0) {
-      console.log(`📋 Removing ${patientLineIndex} garbage line(s) before patient name`);
+      debugLog(`📋 Removing ${patientLineIndex} garbage line(s) before patient name`);
       lines = lines.slice(patientLineIndex);
-      console.log('📋 Restructured lines:', lines.slice(0, 5));
+      debugLog('📋 Restructured lines:', lines.slice(0, 5));
     }
     
     const cleanLines = lines;
-    console.log('📋 Clean lines starting with patient name on Line 0');
+    debugLog('📋 Clean lines starting with patient name on Line 0');
     
     // Warn if OCR text looks incomplete
     if (cleanLines.length > 0 && /^[|_&>-]|take|mouth|day/i.test(cleanLines[0])) {
@@ -160,15 +292,15 @@ export class OCRService {
    * - null if drug name found before patient name (needs rescan)
    */
   private static async findPatientNameLine(lines: string[]): Promise<number | null> {
-    console.log('🔍 Searching for patient name line...');
+    debugLog('🔍 Searching for patient name line...');
     
     for (let i = 0; i < Math.min(5, lines.length); i++) {
       const line = lines[i];
-      console.log(`🔍 Checking line ${i}: "${line}"`);
+      debugLog(`🔍 Checking line ${i}: "${line}"`);
       
       // Skip pure garbage lines (only symbols/punctuation)
       if (/^[^A-Za-z0-9]*$|^[-—_=]{2,}$/.test(line)) {
-        console.log(`⚠️ Line ${i} is garbage (symbols only)`);
+        debugLog(`⚠️ Line ${i} is garbage (symbols only)`);
         continue;
       }
       
@@ -184,22 +316,25 @@ export class OCRService {
         const fullName = firstName + ' ' + lastName;
         
         if (fullName.length >= 5 && fullName.length <= 30) {
-          console.log(`🔍 Found potential name: "${fullName}"`);
+          debugLog(`🔍 Found potential name: "${fullName}"`);
           
           // PRIORITY 1: Check if it's in local patient database (fastest, most reliable)
           const isKnownPatient = await MedicationDatabase.isKnownLocalPatient(firstName, lastName);
           if (isKnownPatient) {
-            console.log(`✅ Line ${i} confirmed as known patient (local DB): "${fullName}"`);
+            debugLog(`✅ Line ${i} confirmed as known patient (local DB): "${fullName}"`);
             return i; // Skip medication check entirely
           }
           
           // PRIORITY 2: Check if it's a medication (with 90% similarity requirement)
-          const fullNameIsMed = await MedicationDatabase.isMedicationStrict(fullName);
-          const firstNameIsMed = await MedicationDatabase.isMedicationStrict(firstName);
-          const lastNameIsMed = await MedicationDatabase.isMedicationStrict(lastName);
+          // The three checks are independent, so run them concurrently
+          const [fullNameIsMed, firstNameIsMed, lastNameIsMed] = await Promise.all([
+            MedicationDatabase.isMedicationStrict(fullName),
+            MedicationDatabase.isMedicationStrict(firstName),
+            MedicationDatabase.isMedicationStrict(lastName),
+          ]);
           
           if (fullNameIsMed || firstNameIsMed || lastNameIsMed) {
-            console.log(`❌ Line ${i} contains medication name, not patient name`);
+            debugLog(`❌ Line ${i} contains medication name, not patient name`);
             // Drug found before patient - need rescan
             return null;
           }
@@ -207,12 +342,12 @@ export class OCRService {
           // Check if it's a valid person name (local DB or online)
           const isValidName = await MedicationDatabase.isLikelyPersonName(firstName, lastName);
           if (isValidName) {
-            console.log(`✅ Line ${i} confirmed as patient name: "${fullName}"`);
+            debugLog(`✅ Line ${i} confirmed as patient name: "${fullName}"`);
             return i;
           }
           
           // Even if not in name database, accept if reasonable length and not a med
-          console.log(`✓ Line ${i} accepted as patient name (not in DB): "${fullName}"`);
+          debugLog(`✓ Line ${i} accepted as patient name (not in DB): "${fullName}"`);
           return i;
         }
       }
@@ -223,13 +358,13 @@ export class OCRService {
         const possibleDrug = drugMatch[1].toUpperCase();
         const isDrug = await MedicationDatabase.isMedicationStrict(possibleDrug);
         if (isDrug) {
-          console.log(`❌ Line ${i} contains drug name "${possibleDrug}" - patient name not found before drug`);
+          debugLog(`❌ Line ${i} contains drug name "${possibleDrug}" - patient name not found before drug`);
           return null; // Need rescan
         }
       }
     }
     
-    console.log('❌ No patient name found in first 5 lines');
+    debugLog('❌ No patient name found in first 5 lines');
     return -1; // No patient name found
   }
 
@@ -240,11 +375,11 @@ export class OCRService {
   private static async extractPatientName(lines: string[]): Promise<string | undefined> {
     if (lines.length === 0) return undefined;
     
-    console.log('🔍 Extracting patient name from line 0:', lines[0]);
+    debugLog('🔍 Extracting patient name from line 0:', lines[0]);
     
     // Clean the line - remove all symbols except hyphens, parentheses, letters, and spaces
     const firstLine = lines[0].replace(/[^A-Za-z\s\-()]/g, '').trim();
-    console.log('🔍 After cleaning:', firstLine);
+    debugLog('🔍 After cleaning:', firstLine);
     
     // Parse patient name: FIRSTNAME LASTNAME (now handles trailing punctuation)
     const nameMatch = firstLine.match(/^([A-Z][A-Z]{2,})\s+([A-Z][A-Z]+)/i);
@@ -252,14 +387,14 @@ export class OCRService {
       let firstName = nameMatch[1].trim().toUpperCase();
       let lastName = nameMatch[2].trim().toUpperCase();
       let fullName = firstName + ' ' + lastName;
-      console.log(`🔍 Found name pattern: ${fullName}`);
+      debugLog(`🔍 Found name pattern: ${fullName}`);
       
       if (fullName.length >= 5 && fullName.length <= 30) {
         // PRIORITY 1: Check local patient database and correct OCR errors with fuzzy matching
         const localPatients = await MedicationDatabase.getLocalPatients();
         
         if (localPatients && localPatients.length > 0) {
-          console.log(`📦 Checking against ${localPatients.length} local patient(s)`);
+          debugLog(`📦 Checking against ${localPatients.length} local patient(s)`);
           
           // Fuzzy match helper using Levenshtein distance
           const fuzzyMatch = (str1: string, str2: string): number => {
@@ -293,39 +428,44 @@ export class OCRService {
           };
           
           // Find best match in local database (80% similarity threshold for OCR errors)
+          // Uppercase each stored name once up front instead of re-converting inside the loop
+          const patientsUpper = localPatients.map(patient => ({
+            firstName: patient.firstName.toUpperCase(),
+            lastName: patient.lastName.toUpperCase(),
+          }));
           let bestMatch: {firstName: string, lastName: string, similarity: number} | null = null;
-          
-          for (const patient of localPatients) {
-            const firstNameSimilarity = fuzzyMatch(firstName, patient.firstName.toUpperCase());
-            const lastNameSimilarity = fuzzyMatch(lastName, patient.lastName.toUpperCase());
+
+          for (const patient of patientsUpper) {
+            const firstNameSimilarity = fuzzyMatch(firstName, patient.firstName);
+            const lastNameSimilarity = fuzzyMatch(lastName, patient.lastName);
             const averageSimilarity = (firstNameSimilarity + lastNameSimilarity) / 2;
-            
-            console.log(`   Comparing "${firstName} ${lastName}" to "${patient.firstName} ${patient.lastName}": ${(averageSimilarity * 100).toFixed(1)}%`);
-            
+
+            debugLog(`   Comparing "${firstName} ${lastName}" to "${patient.firstName} ${patient.lastName}": ${(averageSimilarity * 100).toFixed(1)}%`);
+
             if (averageSimilarity >= 0.8 && (!bestMatch || averageSimilarity > bestMatch.similarity)) {
               bestMatch = {
-                firstName: patient.firstName.toUpperCase(),
-                lastName: patient.lastName.toUpperCase(),
+                firstName: patient.firstName,
+                lastName: patient.lastName,
                 similarity: averageSimilarity
               };
             }
           }
           
           if (bestMatch) {
-            console.log(`✓ Corrected OCR name: "${firstName} ${lastName}" → "${bestMatch.firstName} ${bestMatch.lastName}" (${(bestMatch.similarity * 100).toFixed(1)}% match)`);
+            debugLog(`✓ Corrected OCR name: "${firstName} ${lastName}" → "${bestMatch.firstName} ${bestMatch.lastName}" (${(bestMatch.similarity * 100).toFixed(1)}% match)`);
             firstName = bestMatch.firstName;
             lastName = bestMatch.lastName;
             fullName = firstName + ' ' + lastName;
             return fullName;
           } else {
-            console.log(`⚠️ No match found in local database (< 80% similarity)`);
+            debugLog(`⚠️ No match found in local database (< 80% similarity)`);
           }
         }
         
         // PRIORITY 2: Check if exact match in local database
         const isKnownPatient = await MedicationDatabase.isKnownLocalPatient(firstName, lastName);
         if (isKnownPatient) {
-          console.log(`✓ Extracted known patient name (exact local DB match): ${fullName}`);
+          debugLog(`✓ Extracted known patient name (exact local DB match): ${fullName}`);
           return fullName;
         }
         
@@ -335,14 +475,14 @@ export class OCRService {
           const firstNameIsMed = await MedicationDatabase.isMedicationStrict(firstName);
           
           if (fullNameIsMed || firstNameIsMed) {
-            console.log('⚠️ Name matches a medication, rejecting');
+            debugLog('⚠️ Name matches a medication, rejecting');
             return undefined;
           }
         } catch (error) {
           console.warn('⚠️ Could not validate against medication database:', error);
         }
         
-        console.log(`✓ Extracted patient name: ${fullName}`);
+        debugLog(`✓ Extracted patient name: ${fullName}`);
         return fullName;
       }
     }
@@ -359,7 +499,7 @@ export class OCRService {
     if (lines.length < 2) return undefined;
     
     const line = lines[1];
-    console.log('🔍 Extracting strength from Line 1:', line);
+    debugLog('🔍 Extracting strength from Line 1:', line);
     
     // Look for strength with explicit units: 100MG, 500MCG, 2.5ML
     const strengthPattern = /(\d+(?:\.\d+)?)\s*(MG|MCG|G|ML|UNITS?)\b/i;
@@ -371,12 +511,12 @@ export class OCRService {
       
       // Reasonable strength range
       if (num >= 1 && num <= 10000) {
-        console.log('✓ Found strength:', strength);
+        debugLog('✓ Found strength:', strength);
         return strength;
       }
     }
     
-    console.log('⚠️ No strength found on Line 1');
+    debugLog('⚠️ No strength found on Line 1');
     return undefined;
   }
 
@@ -388,23 +528,23 @@ export class OCRService {
   private static async extractDrugName(lines: string[], patientName?: string): Promise<string | undefined> {
     if (lines.length === 0) return undefined;
     
-    console.log('🔍 Extracting drug name...');
+    debugLog('🔍 Extracting drug name...');
     
     // Determine starting line: if patient on line 0, drug is on line 1; otherwise drug is on line 0
     let startLine = 0;
     if (patientName && lines.length > 0 && lines[0].toUpperCase().includes(patientName)) {
       startLine = 1; // Patient on line 0, so drug on line 1
-      console.log('🔍 Patient on line 0, checking line 1 for drug');
+      debugLog('🔍 Patient on line 0, checking line 1 for drug');
     } else {
-      console.log('🔍 No patient on line 0, checking line 0 for drug');
+      debugLog('🔍 No patient on line 0, checking line 0 for drug');
     }
     
     // PRIORITY: Check the expected line first (line 2 if patient on line 1, else line 1)
     if (startLine < lines.length) {
-      console.log(`🔍 Checking line ${startLine}: "${lines[startLine]}"`);
+      debugLog(`🔍 Checking line ${startLine}: "${lines[startLine]}"`);
       const drugName = await this.parseDrugFromLine(lines[startLine], patientName);
       if (drugName) {
-        console.log(`✓ Found drug on line ${startLine}: ${drugName}`);
+        debugLog(`✓ Found drug on line ${startLine}: ${drugName}`);
         return drugName;
       }
     }
@@ -413,7 +553,7 @@ export class OCRService {
     for (let i = 0; i < Math.min(10, lines.length); i++) {
       if (i === startLine) continue; // Already checked
       if (i === 0 && patientName) continue; // Skip line 0 if it has patient name
-      console.log(`🔍 Fallback checking line ${i}: "${lines[i]}"`);
+      debugLog(`🔍 Fallback checking line ${i}: "${lines[i]}"`);
       const line = lines[i];
       
       const drugName = await this.parseDrugFromLine(line, patientName);
@@ -430,6 +570,37 @@ export class OCRService {
    * Handles multi-word drug names like "DOXYCYCLINE MONOHYDRATE"
    */
   private static async parseDrugFromLine(line: string, patientName?: string): Promise<string | undefined> {
+    // Clean the line: remove all symbols except hyphens, parentheses, letters, and spaces
+    const cleaned = line.replace(/[^A-Za-z0-9\s\-()]/g, '').trim();
+    if (cleaned.length < 3) {
+      return undefined;
+    }
+
+    // Run the cheap single-regex rejects before the fuzzy patient-name scan
+    // below, so obvious non-drug lines never pay for it.
+    // Skip garbage lines, address lines, pharmacy info, manufacturer info, or instruction lines
+    // Address detection: Look for common address patterns
+    // - Street suffixes: DR, DRIVE, STREET, AVE, RD, BLVD, HWY, LANE, CT, etc.
+    // - Format: "123 STREET NAME" or "STREET NAME DR"
+    if (STREET_SUFFIX_REGEX.test(cleaned)) {
+      return undefined;
+    }
+
+    // Skip lines with 4+ digits (likely address numbers, zip codes, RX numbers without dashes)
+    if (LONG_DIGITS_REGEX.test(cleaned)) {
+      return undefined;
+    }
+
+    // Skip pharmacy-related lines
+    if (PHARMACY_INFO_REGEX.test(cleaned)) {
+      return undefined;
+    }
+
+    // Skip manufacturer lines
+    if (MANUFACTURER_REGEX.test(cleaned)) {
+      return undefined;
+    }
+
     // Skip lines containing patient name parts (handles OCR errors)
     if (patientName) {
       const nameParts = patientName.toUpperCase().split(' ').filter(part => part.length >= 3);
@@ -439,7 +610,7 @@ export class OCRService {
       for (const namePart of nameParts) {
         // Exact match or very close match (accounting for OCR errors)
         if (lineUpper.includes(namePart)) {
-          console.log(`⏭️ Skipping line containing patient name "${namePart}": "${line}"`);
+          debugLog(`⏭️ Skipping line containing patient name "${namePart}": "${line}"`);
           return undefined;
         }
         
@@ -448,52 +619,25 @@ export class OCRService {
         const words = lineUpper.split(/\s+/);
         for (const word of words) {
           if (word.length < 3) continue;
-          
-          // Calculate character overlap
+
+          // Calculate character overlap via set membership rather than
+          // scanning the word once per character
+          const wordChars = new Set(word);
           let matchCount = 0;
           for (const char of namePart) {
-            if (word.includes(char)) matchCount++;
+            if (wordChars.has(char)) matchCount++;
           }
           
           // If >70% of name part characters appear in this word, likely same name
           const similarity = matchCount / namePart.length;
           if (similarity > 0.7 && Math.abs(word.length - namePart.length) <= 3) {
-            console.log(`⏭️ Skipping line with fuzzy name match "${namePart}" ≈ "${word}": "${line}"`);
+            debugLog(`⏭️ Skipping line with fuzzy name match "${namePart}" ≈ "${word}": "${line}"`);
             return undefined;
           }
         }
       }
     }
     
-    // Clean the line: remove all symbols except hyphens, parentheses, letters, and spaces
-    const cleaned = line.replace(/[^A-Za-z0-9\s\-()]/g, '').trim();
-    if (cleaned.length < 3) {
-      return undefined;
-    }
-      
-    // Skip garbage lines, address lines, pharmacy info, manufacturer info, or instruction lines
-    // Address detection: Look for common address patterns
-    // - Street suffixes: DR, DRIVE, STREET, AVE, RD, BLVD, HWY, LANE, CT, etc.
-    // - Format: "123 STREET NAME" or "STREET NAME DR"
-    if (/\b(street|st|avenue|ave|road|rd|drive|dr|boulevard|blvd|lane|ln|court|ct|circle|cir|way|place|pl|highway|hwy|parkway|pkwy)\b[,\s]|[,\s]\b(street|st|avenue|ave|road|rd|drive|dr|boulevard|blvd|lane|ln|court|ct|circle|cir|way|place|pl|highway|hwy|parkway|pkwy)\b/i.test(cleaned)) {
-      return undefined;
-    }
-    
-    // Skip lines with 4+ digits (likely address numbers, zip codes, RX numbers without dashes)
-    if (/\d{4,}/.test(cleaned)) {
-      return undefined;
-    }
-    
-    // Skip pharmacy-related lines
-    if (/pharmacy|take\s+\d|tablet|capsule|by mouth|meal|hour|day|refill|dr\.\s*auth/i.test(cleaned)) {
-      return undefined;
-    }
-    
-    // Skip manufacturer lines
-    if (/^(mfg|manuf|manufacturer)/i.test(cleaned)) {
-      return undefined;
-    }
-      
     // PATTERN 1: Multi-word drug name (e.g., "DOXYCYCLINE MONOHYDRATE", "DOXYCYCLINE MONO»")
     // Check first 1-3 words for medication match
     const words = cleaned.split(/\s+/).filter(w => /^[A-Z]/i.test(w));
@@ -504,12 +648,12 @@ export class OCRService {
       if (twoWords.length >= 8) {
         const validated = await MedicationDatabase.findClosestMedication(twoWords);
         if (validated) {
-          console.log(`✓ Matched multi-word drug: "${twoWords}" -> "${validated}"`);
+          debugLog(`✓ Matched multi-word drug: "${twoWords}" -> "${validated}"`);
           return validated;
         }
         // If no database match but looks like a valid drug name format, use OCR text
         if (/^[A-Z]{3,}\s+[A-Z]{2,}$/.test(twoWords)) {
-          console.log(`✓ Using OCR text for drug (not in database): "${twoWords}"`);
+          debugLog(`✓ Using OCR text for drug (not in database): "${twoWords}"`);
           return twoWords;
         }
       }
@@ -521,7 +665,7 @@ export class OCRService {
       if (threeWords.length >= 10) {
         const validated = await MedicationDatabase.findClosestMedication(threeWords);
         if (validated) {
-          console.log(`✓ Matched multi-word drug: "${threeWords}" -> "${validated}"`);
+          debugLog(`✓ Matched multi-word drug: "${threeWords}" -> "${validated}"`);
           return validated;
         }
       }
@@ -611,18 +755,11 @@ export class OCRService {
     if (lines.length < 3) return undefined;
     
     const relevantLines = lines.slice(2, 5);
-    console.log('🔍 Extracting dosage from Lines 2-4:', relevantLines);
+    debugLog('🔍 Extracting dosage from Lines 2-4:', relevantLines);
     
     const text = relevantLines.join(' ');
     
-    const dosagePatterns = [
-      // Look for "1 TABLET", "2 CAPSULES", "1 CAPSULE" etc. - most specific first
-      /(?:take|give|swallow|inject)\s*["']?[^"']*["']?\s*(\d+(?:\.\d+)?\s*(?:tablet|capsule|pill)s?)/i,
-      /(\d+(?:\.\d+)?\s*(?:tablet|capsule|pill)s?)\s*by\s*mouth/i,
-      /(\d+(?:\.\d+)?\s*(?:tablet|capsule|pill)s?)/i,
-    ];
-
-    for (const pattern of dosagePatterns) {
+    for (const pattern of DOSAGE_PATTERNS) {
       const match = text.match(pattern);
       if (match && match[1]) {
         // Normalize whitespace (replace newlines/multiple spaces with single space)
@@ -631,7 +768,7 @@ export class OCRService {
         if (strength && dosage === strength) {
           continue; // Skip if it matches strength
         }
-        console.log('✓ Found dosage:', dosage);
+        debugLog('✓ Found dosage:', dosage);
         return dosage;
       }
     }
@@ -649,28 +786,11 @@ export class OCRService {
     if (lines.length < 3) return undefined;
     
     const relevantLines = lines.slice(2, 8);
-    console.log('🔍 Extracting frequency from Lines 2-7:', relevantLines);
+    debugLog('🔍 Extracting frequency from Lines 2-7:', relevantLines);
     
     const text = relevantLines.join(' ');
     
-    const frequencyPatterns = [
-      // Most specific patterns first - prioritize "TWICE DAILY" over generic
-      /(?:by\s+)?mouth\s+(once|twice|three times|four times)\s*(?:per\s+day|daily|dai[ly)]?|py|dal)/i,
-      /(once|twice|three times|four times)\s*(?:per|a|each)?\s*(?:day|daily|dai[ly)]?|py|dal)/i,
-      /(?:take|use)\s+(\d+\s*times?\s*(?:per|a|each)\s*day)/i,
-      /(\d+\s*times?\s*daily)/i,
-      // Handle OCR errors: "VERY 12 HOURS" or "EVERY 12 HOURS"
-      /([ev]very\s+\d+\s*(?:to\s+\d+\s*)?hours?)/i,
-      /(every\s+(?:morning|night|evening))/i,
-      /(morning and evening|morning and night)/i,
-      /(BID|TID|QID|QD|PRN)/i,  // Medical abbreviations
-      // Generic daily/weekly/monthly - LAST priority
-      /(daily|weekly|monthly)/i,
-      // Fallback for badly OCR'd "EVERY X HOURS" pattern
-      /(\d+\s*hours?)/i,
-    ];
-
-    for (const pattern of frequencyPatterns) {
+    for (const pattern of FREQUENCY_PATTERNS) {
       const match = text.match(pattern);
       if (match && match[1]) {
         let frequency = match[1].trim();
@@ -694,7 +814,7 @@ export class OCRService {
         // Normalize medical abbreviations
         frequency = this.normalizeMedicalAbbreviation(frequency);
         
-        console.log('✓ Found frequency:', frequency.toUpperCase());
+        debugLog('✓ Found frequency:', frequency.toUpperCase());
         return frequency.toUpperCase();
       }
     }
@@ -711,29 +831,21 @@ export class OCRService {
     if (lines.length < 3) return undefined;
     
     const relevantLines = lines.slice(2, 8);
-    console.log('🔍 Extracting duration from Lines 2-7:', relevantLines);
+    debugLog('🔍 Extracting duration from Lines 2-7:', relevantLines);
     
     const text = relevantLines.join(' ');
     
     // Check for "AS NEEDED" first (common for PRN medications)
     // Handle OCR errors: "AS NEE", "AS NEED", "PRN"
     if (/AS\s+NEE[D]?|PRN/i.test(text)) {
-      console.log('✓ Found duration: AS NEEDED');
+      debugLog('✓ Found duration: AS NEEDED');
       return 'AS NEEDED';
     }
     
-    const durationPatterns = [
-      // Handle leading OCR errors: "sFOR 7 DAYS", "FOR 7 DAYS"
-      /[a-z]*for\s+(\d+\s*(?:day|week|month)s?)/i,
-      /(\d+\s*(?:day|week|month)s?)/i,
-      /(\d+\s*day\s*supply)/i,
-      /(until\s+gone|until\s+finished)/i,
-    ];
-
-    for (const pattern of durationPatterns) {
+    for (const pattern of DURATION_PATTERNS) {
       const match = text.match(pattern);
       if (match && match[1]) {
-        console.log('✓ Found duration:', match[1].trim());
+        debugLog('✓ Found duration:', match[1].trim());
         return match[1].trim();
       }
     }
@@ -750,20 +862,14 @@ export class OCRService {
     if (lines.length < 3) return undefined;
     
     const relevantLines = lines.slice(2, 8);
-    console.log('🔍 Extracting additional instructions from Lines 2-7:', relevantLines);
+    debugLog('🔍 Extracting additional instructions from Lines 2-7:', relevantLines);
     
     const text = relevantLines.join(' ');
     const instructions: string[] = [];
     
     // Administration route patterns
-    const routePatterns = [
-      /BY\s+MOUTH/i,
-      /ORALLY/i,
-      /SUBLINGUAL/i,
-      /TOPICALLY/i,
-    ];
     
-    for (const pattern of routePatterns) {
+    for (const pattern of ROUTE_PATTERNS) {
       const match = text.match(pattern);
       if (match) {
         instructions.push(match[0].toUpperCase());
@@ -772,14 +878,8 @@ export class OCRService {
     }
     
     // Meal timing patterns
-    const mealPatterns = [
-      /WITH\s+(?:MEALS?|FOOD)/i,
-      /AFTER\s+MEALS?/i,
-      /BEFORE\s+MEALS?/i,
-      /ON\s+(?:AN\s+)?EMPTY\s+STOMACH/i,
-    ];
     
-    for (const pattern of mealPatterns) {
+    for (const pattern of MEAL_PATTERNS) {
       const match = text.match(pattern);
       if (match) {
         instructions.push(match[0].toUpperCase());
@@ -803,7 +903,7 @@ export class OCRService {
     
     if (instructions.length > 0) {
       const result = instructions.join('; ');
-      console.log('✓ Found additional instructions:', result);
+      debugLog('✓ Found additional instructions:', result);
       return result;
     }
     
@@ -822,27 +922,13 @@ export class OCRService {
     
     // Check lines 6-8 for RX number
     const searchLines = lines.slice(6, 9);
-    console.log('🔍 Searching Lines 6-8 for RX number:', searchLines);
+    debugLog('🔍 Searching Lines 6-8 for RX number:', searchLines);
     
     for (const line of searchLines) {
       // Clean line - remove leading/trailing non-alphanumeric
       const cleaned = line.replace(/^[^A-Z0-9]+/gi, '').replace(/[!@#$%^&*()]+$/g, '');
       
-      const rxPatterns = [
-        /RX\s*#?\s*:?\s*([0-9-\/]+)/i,
-        /RX\s*NUMBER\s*:?\s*([0-9-\/]+)/i,
-        /PRESCRIPTION\s*#?\s*:?\s*([0-9-\/]+)/i,
-        // Handle OCR errors with leading pipes and 'x': "| x0958223-10613"
-        /[|\s]*[xX]\s*(\d{7,10}-\d{3,5})/,
-        // Handle OCR errors: "F", "%", "x", "sx" prefix before number
-        /^[FfPp%xXsS]*\s*(\d{7,10}-\d{3,5}[!\/]?\d*)/,
-        // Direct pattern: 1999830-095/74 or 1399830-0957!
-        /\b(\d{7,10}-\d{3}\/\d{1,2})/,
-        /\b(\d{7,10}-\d{4,5}[!]?)/,
-        /\b(\d{7,10})\b/,  // Just digits (fallback)
-      ];
-
-      for (const pattern of rxPatterns) {
+      for (const pattern of RX_PATTERNS) {
         const match = line.match(pattern);
         if (match && match[1]) {
           let rxNum = match[1].trim();
@@ -856,14 +942,14 @@ export class OCRService {
           // Must be at least 7 digits total
           const digitCount = rxNum.replace(/[^0-9]/g, '').length;
           if (digitCount >= 7) {
-            console.log('✓ Found RX number:', rxNum);
+            debugLog('✓ Found RX number:', rxNum);
             return rxNum;
           }
         }
       }
     }
 
-    console.log('⚠️ No RX number found on Lines 5-7');
+    debugLog('⚠️ No RX number found on Lines 5-7');
     return undefined;
   }
 
@@ -890,7 +976,7 @@ export class OCRService {
     if (lines.length < 8) return undefined;
     
     const searchLines = [lines[7], lines.length > 8 ? lines[8] : '', lines.length > 9 ? lines[9] : ''];
-    console.log('🔍 Extracting quantity from Lines 7-9:', searchLines);
+    debugLog('🔍 Extracting quantity from Lines 7-9:', searchLines);
     
     for (const line of searchLines) {
       if (!line) continue;
@@ -900,7 +986,7 @@ export class OCRService {
       if (prefixMatch) {
         const qty = parseInt(prefixMatch[1], 10);
         if (qty >= 1 && qty <= 1000) {
-          console.log('✓ Found quantity (OCR corrected):', prefixMatch[1]);
+          debugLog('✓ Found quantity (OCR corrected):', prefixMatch[1]);
           return prefixMatch[1];
         }
       }
@@ -909,28 +995,19 @@ export class OCRService {
       if (/^(\d{1,3})$/.test(line)) {
         const qty = parseInt(line, 10);
         if (qty >= 1 && qty <= 1000) {
-          console.log('✓ Found quantity:', line);
+          debugLog('✓ Found quantity:', line);
           return line;
         }
       }
       
       // Try pattern matching on this line
-      const qtyPatterns = [
-        /QTY\s*:?\s*(\d+)/i,
-        /QUANTITY\s*:?\s*(\d+)/i,
-        /[ao0rt][y]\s*:?\s*(\d+)/i,
-        /#\s*(\d+)/,
-        /[~-]\s*(\d{1,3})\b/,
-        /\b(\d+)\s*(?:tablets?|capsules?|pills?)\b/i,
-      ];
-
-      for (const pattern of qtyPatterns) {
+      for (const pattern of QTY_PATTERNS) {
         const match = line.match(pattern);
         if (match && match[1]) {
           const qty = match[1].trim();
           const qtyNum = parseInt(qty, 10);
           if (qtyNum >= 1 && qtyNum <= 1000) {
-            console.log('✓ Found quantity:', qty);
+            debugLog('✓ Found quantity:', qty);
             return qty;
           }
         }
@@ -950,13 +1027,13 @@ export class OCRService {
     if (lines.length < 8) return undefined;
     
     const relevantLines = lines.slice(7, 10);
-    console.log('🔍 Extracting refills from Lines 7-9:', relevantLines);
+    debugLog('🔍 Extracting refills from Lines 7-9:', relevantLines);
     
     const text = relevantLines.join(' ');
     
     // Check for explicit "NO REFILLS" text
     if (/NO\s*REFILLS?/i.test(text)) {
-      console.log('✓ Found refills: NO REFILLS');
+      debugLog('✓ Found refills: NO REFILLS');
       return 'NO REFILLS';
     }
     
@@ -969,38 +1046,30 @@ export class OCRService {
       refillText = refillText.replace(/B/g, '8').replace(/S/g, '5').replace(/O/g, '0');
       // "P", "yw" often means "0" or "NO"
       if (/^[Ppyw0]+$/.test(refillText)) {
-        console.log('✓ Found refills: NO REFILLS (OCR corrected from P/0/yw)');
+        debugLog('✓ Found refills: NO REFILLS (OCR corrected from P/0/yw)');
         return 'NO REFILLS';
       }
       const refillCount = refillText.replace(/[^0-9]/g, '');
       if (refillCount && parseInt(refillCount) >= 0) {
-        console.log(`✓ Found refills: ${refillCount}`);
+        debugLog(`✓ Found refills: ${refillCount}`);
         return refillCount;
       }
     }
     
     // Try additional patterns
-    const refillPatterns = [
-      /REFILLS?\s*:?\s*(\d+|none|no)/i,
-      /REFILLS?\s*REMAINING\s*:?\s*(\d+)/i,
-      /(\d+)\s*REFILLS?/i,
-      // Handle OCR errors: VREFILLS, MREFILLS, etc.
-      /[VM]REFILLS?\s*:?\s*(\d+|none|no)/i,
-    ];
-
-    for (const pattern of refillPatterns) {
+    for (const pattern of REFILL_PATTERNS) {
       const match = text.match(pattern);
       if (match && match[1]) {
         const refills = match[1].trim().toLowerCase();
         // "no" or "none" = "NO REFILLS"
         if (refills === 'no' || refills === 'none') {
-          console.log('✓ Found refills: NO REFILLS');
+          debugLog('✓ Found refills: NO REFILLS');
           return 'NO REFILLS';
         }
         // Check if it's a valid number
         const refillNum = parseInt(refills, 10);
         if (!isNaN(refillNum) && refillNum >= 0 && refillNum <= 99) {
-          console.log('✓ Found refills:', refills);
+          debugLog('✓ Found refills:', refills);
           return refills;
         }
       }
@@ -1019,22 +1088,14 @@ export class OCRService {
     if (lines.length < 6) return undefined;
     
     const relevantLines = lines.slice(5, 9);
-    console.log('🔍 Extracting refills before date from Lines 5-8:', relevantLines);
+    debugLog('🔍 Extracting refills before date from Lines 5-8:', relevantLines);
     
     const text = relevantLines.join(' ');
     
-    const datePatterns = [
-      // Handle OCR errors: NEFILLS, VEFILLS, MEFILLS instead of REFILLS
-      /(?:RE|NE|VE|ME)?FILLS?\s+BEFORE\s*:?\s*(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})/i,
-      /(?:RE|NE|VE|ME)?FILL\s+BY\s*:?\s*(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})/i,
-      /(?:RE|NE|VE|ME)?FILLS?\s+VALID\s+UNTIL\s*:?\s*(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})/i,
-      /(?:RE|NE|VE|ME)?FILLS?\s+EXPIRE\s*:?\s*(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})/i,
-    ];
-
-    for (const pattern of datePatterns) {
+    for (const pattern of REFILL_DATE_PATTERNS) {
       const match = text.match(pattern);
       if (match && match[1]) {
-        console.log('✓ Found refills before date:', match[1].trim());
+        debugLog('✓ Found refills before date:', match[1].trim());
         return match[1].trim();
       }
     }
@@ -1047,16 +1108,9 @@ export class OCRService {
    * Usually appears at top or bottom of prescription labels
    */
   private static extractPharmacy(lines: string[]): string | undefined {
-    const pharmacyPatterns = [
-      /^(.+\s+PHARMACY)/i,
-      /^(.+\s+DRUG)/i,
-      /^(PHARMACY\s+.+)/i,
-      /^(CVS|WALGREENS|WALMART|RITE\s*AID|KROGER|SAFEWAY|PUBLIX)/i,
-    ];
-
     // First try to find explicit pharmacy name
     for (const line of lines) {
-      for (const pattern of pharmacyPatterns) {
+      for (const pattern of PHARMACY_PATTERNS) {
         const match = line.match(pattern);
         if (match && match[1]) {
           const pharmacy = match[1].trim().toUpperCase();
@@ -1069,16 +1123,9 @@ export class OCRService {
 
     // Fallback: Look for pharmacy names anywhere in the text or derive from address
     const allText = lines.join(' ');
-    const commonPharmacies = [
-      'WALGREENS', 'CVS', 'WALMART', 'RITE AID', 'KROGER', 
-      'SAFEWAY', 'PUBLIX', 'TARGET', 'COSTCO', 'SAM\'S CLUB',
-      'HEB', 'H-E-B', 'H E B'
-    ];
-    
-    for (const pharmacy of commonPharmacies) {
-      if (new RegExp(pharmacy, 'i').test(allText)) {
-        return pharmacy;
-      }
+    const chainMatch = allText.match(COMMON_PHARMACY_REGEX);
+    if (chainMatch) {
+      return chainMatch[1].toUpperCase().replace(/\s+/g, ' ');
     }
     
     // Check if address contains pharmacy-like words
@@ -1106,7 +1153,7 @@ export class OCRService {
     if (lines.length < 3) return undefined;
     
     const relevantLines = lines.slice(-3);
-    console.log('🔍 Extracting pharmacy phone from last 3 lines:', relevantLines);
+    debugLog('🔍 Extracting pharmacy phone from last 3 lines:', relevantLines);
     
     // First, try to reconstruct phone from split lines
     // Example 1: "979) 7 6" + "2S) 179-2006" -> "(979) 779-2006"
@@ -1124,7 +1171,7 @@ export class OCRService {
       const phone = areaCode + correctedExchange + lineNum;
       if (phone.length === 10) {
         const formattedPhone = `(${phone.slice(0,3)}) ${phone.slice(3,6)}-${phone.slice(6)}`;
-        console.log('✓ Found pharmacy phone (reconstructed from split):', formattedPhone);
+        debugLog('✓ Found pharmacy phone (reconstructed from split):', formattedPhone);
         return formattedPhone;
       }
     }
@@ -1152,20 +1199,11 @@ export class OCRService {
       const phone = areaCode + finalExchange + finalLineNum;
       if (phone.length === 10) {
         const formattedPhone = `(${phone.slice(0,3)}) ${phone.slice(3,6)}-${phone.slice(6)}`;
-        console.log('✓ Found pharmacy phone (reconstructed from malformed):', formattedPhone);
+        debugLog('✓ Found pharmacy phone (reconstructed from malformed):', formattedPhone);
         return formattedPhone;
       }
     }
     
-    const phonePatterns = [
-      // Phone with parentheses: (832) 934-0415
-      /\((\d{3})\)\s*(\d{3})[-.]?(\d{4})/,
-      // Phone without parentheses: 832-934-0415
-      /\b(\d{3})[-. ](\d{3})[-. ](\d{4})\b/,
-      // Handle partial OCR: missing opening paren like "979) 779-2006" or "1) 779-2006"
-      /(\d{1,3})\)\s*(\d{3})[-.]?(\d{4})/,
-    ];
-
     // Get all matches and filter out RX numbers
     for (const line of relevantLines) {
       // Skip lines that look like RX numbers (7+ digits before dash)
@@ -1173,7 +1211,7 @@ export class OCRService {
         continue;
       }
       
-      for (const pattern of phonePatterns) {
+      for (const pattern of PHONE_PATTERNS) {
         const match = line.match(pattern);
         if (match) {
           let phone: string;
@@ -1212,7 +1250,7 @@ export class OCRService {
           
           if (phone.length === 10) {
             const formattedPhone = `(${phone.slice(0,3)}) ${phone.slice(3,6)}-${phone.slice(6)}`;
-            console.log('✓ Found pharmacy phone:', formattedPhone);
+            debugLog('✓ Found pharmacy phone:', formattedPhone);
             return formattedPhone;
           }
         }
@@ -1226,12 +1264,7 @@ export class OCRService {
    * Extract general instructions
    */
   private static extractInstructions(text: string): string | undefined {
-    const instructionPatterns = [
-      /(?:take|use|apply)\s+([^.]+)/i,
-      /(?:directions|instructions):\s*([^.]+)/i,
-    ];
-
-    for (const pattern of instructionPatterns) {
+    for (const pattern of INSTRUCTION_PATTERNS) {
       const match = text.match(pattern);
       if (match && match[1]) {
         const instruction = match[1].trim();
@@ -15,6 +15,54 @@ async function getUserKey(baseKey: string): Promise<string> {
   return userId ? `${baseKey}_${userId}` : baseKey;
 }
 
+/**
+ * In-memory mirror of the persisted medication array so repeat reads skip
+ * the AsyncStorage round-trip and JSON re-parse, plus an id index so lookups
+ * are a hash hit instead of a linear scan. Reads hand out per-call copies
+ * (see cloneMedication) so caller mutations never leak into the cache.
+ * Keyed by the user-specific storage key so a user switch invalidates
+ * naturally; writes update it, external clears must call
+ * invalidateMedicationsCache().
+ */
+let medicationsCache: {
+  key: string;
+  medications: Medication[];
+  byId: Map<string, Medication>;
+} | null = null;
+
+function setMedicationsCache(key: string, medications: Medication[]): void {
+  medicationsCache = {
+    key,
+    medications,
+    byId: new Map(medications.map(m => [m.id, m])),
+  };
+}
+
+/**
+ * Copy a medication so callers can mutate the result without corrupting
+ * the cache. All fields are primitives except the Date instances, which
+ * get fresh objects.
+ */
+function cloneMedication(med: Medication): Medication {
+  return {
+    ...med,
+    startDate: med.startDate ? new Date(med.startDate) : med.startDate,
+    endDate: med.endDate ? new Date(med.endDate) : undefined,
+    createdAt: med.createdAt ? new Date(med.createdAt) : undefined,
+    updatedAt: med.updatedAt ? new Date(med.updatedAt) : undefined,
+    reminderTimes: Array.isArray(med.reminderTimes)
+      ? med.reminderTimes.map(time => new Date(time))
+      : [],
+  };
+}
+
+/**
+ * Drop the cached medication list (call after clearing/importing storage)
+ */
+export function invalidateMedicationsCache(): void {
+  medicationsCache = null;
+}
+
 /**
  * Save a medication
  */
@@ -22,15 +70,18 @@ export async function saveMedication(medication: Medication): Promise<void> {
   try {
     const medications = await getMedications();
     const index = medications.findIndex(m => m.id === medication.id);
-    
+
+    // Clone the incoming object so the cache never holds a reference the
+    // caller can still mutate after the save resolves
     if (index >= 0) {
-      medications[index] = medication;
+      medications[index] = cloneMedication(medication);
     } else {
-      medications.push(medication);
+      medications.push(cloneMedication(medication));
     }
-    
+
     const key = await getUserKey(STORAGE_KEYS.MEDICATIONS);
     await AsyncStorage.setItem(key, JSON.stringify(medications));
+    setMedicationsCache(key, medications);
   } catch (error) {
     console.error('Error saving medication:', error);
     throw error;
@@ -44,14 +95,17 @@ export async function updateMedication(medication: Medication): Promise<void> {
   try {
     const medications = await getMedications();
     const index = medications.findIndex(m => m.id === medication.id);
+    // Clone before inserting for the same reason as saveMedication: the
+    // cache must only ever hold private copies
     if (index >= 0) {
-      medications[index] = medication;
+      medications[index] = cloneMedication(medication);
     } else {
-      medications.push(medication);
+      medications.push(cloneMedication(medication));
       console.warn('Medication not found locally, adding as new:', medication);
     }
     const key = await getUserKey(STORAGE_KEYS.MEDICATIONS);
     await AsyncStorage.setItem(key, JSON.stringify(medications));
+    setMedicationsCache(key, medications);
   } catch (error) {
     console.error('Error updating medication:', error);
     throw error;
@@ -64,6 +118,9 @@ export async function updateMedication(medication: Medication): Promise<void> {
 export async function getMedications(): Promise<Medication[]> {
   try {
     const key = await getUserKey(STORAGE_KEYS.MEDICATIONS);
+    if (medicationsCache && medicationsCache.key === key) {
+      return medicationsCache.medications.map(cloneMedication);
+    }
     const data = await AsyncStorage.getItem(key);
     if (!data) return [];
     
@@ -76,7 +133,7 @@ export async function getMedications(): Promise<Medication[]> {
     if (!Array.isArray(medications)) return [];
     
     // Convert date strings back to Date objects
-    return medications.map((med: any) => ({
+    const parsed: Medication[] = medications.map((med: any) => ({
       ...med,
       startDate: med.startDate ? new Date(med.startDate) : undefined,
       endDate: med.endDate ? new Date(med.endDate) : undefined,
@@ -84,6 +141,8 @@ export async function getMedications(): Promise<Medication[]> {
         ? med.reminderTimes.map((time: string) => new Date(time))
         : [],
     }));
+    setMedicationsCache(key, parsed);
+    return parsed.map(cloneMedication);
   } catch (error) {
     console.error('Error getting medications:', error);
     return [];
@@ -100,6 +159,7 @@ export async function deleteMedication(medicationId: string): Promise<void> {
     const filtered = safeMeds.filter(m => m.id !== medicationId);
     const key = await getUserKey(STORAGE_KEYS.MEDICATIONS);
     await AsyncStorage.setItem(key, JSON.stringify(filtered));
+    setMedicationsCache(key, filtered);
   } catch (error) {
     console.error('Error deleting medication:', error);
     throw error;
@@ -110,6 +170,11 @@ export async function deleteMedication(medicationId: string): Promise<void> {
  * Get a medication by ID
  */
 export async function getMedicationById(medicationId: string): Promise<Medication | undefined> {
+  const key = await getUserKey(STORAGE_KEYS.MEDICATIONS);
+  if (medicationsCache && medicationsCache.key === key) {
+    const cached = medicationsCache.byId.get(medicationId);
+    return cached ? cloneMedication(cached) : undefined;
+  }
   const medications = await getMedications();
   return medications.find(m => m.id === medicationId);
 }
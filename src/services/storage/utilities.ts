@@ -4,6 +4,7 @@
 
 import AsyncStorage from '@react-native-async-storage/async-storage';
 import { STORAGE_KEYS } from './keys';
+import { invalidateMedicationsCache } from './medications';
 
 /**
  * Clear all data for a specific user
@@ -16,7 +17,8 @@ export async function clearUserData(userId: string): Promise<void> {
     if (userKeys.length > 0) {
       await AsyncStorage.multiRemove(userKeys);
     }
-    
+    invalidateMedicationsCache();
+
     console.log(`Cleared ${userKeys.length} keys for user ${userId}`);
   } catch (error) {
     console.error('Error clearing user data:', error);
@@ -41,7 +43,8 @@ export async function clearAllData(): Promise<void> {
     if (appKeys.length > 0) {
       await AsyncStorage.multiRemove(appKeys);
     }
-    
+    invalidateMedicationsCache();
+
     console.log(`Cleared ${appKeys.length} application keys`);
   } catch (error) {
     console.error('Error clearing all data:', error);
@@ -55,6 +58,7 @@ export async function clearAllData(): Promise<void> {
 export async function clearAllUsersAndData(): Promise<void> {
   try {
     await AsyncStorage.clear();
+    invalidateMedicationsCache();
     console.log('Cleared all AsyncStorage data');
   } catch (error) {
     console.error('Error clearing all users and data:', error);
@@ -146,7 +150,8 @@ export async function importUserData(
     if (pairs.length > 0) {
       await AsyncStorage.multiSet(pairs);
     }
-    
+    invalidateMedicationsCache();
+
     console.log(`Imported ${pairs.length} keys for user ${userId}`);
   } catch (error) {
     console.error('Error importing user data:', error);